@@ -12,11 +12,21 @@ Website: https://mottasec.com
 Contact: ghost@mottasec.com
 """
 
+import atexit
+import io
+import math
+import queue
 import random
+import re
+import sys
+import threading
 import time
-from dns.resolver import resolve
+import dns.resolver
 import smtplib
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 # ANSI color codes for terminal - MottaSec style!
 GREEN = "\033[92m"  # Success - MottaSec Fox approved
@@ -24,7 +34,414 @@ RED = "\033[91m"    # Failure - MottaSec Ghost says no
 BLUE = "\033[94m"   # Info - MottaSec Aces intel
 RESET = "\033[0m"   # Reset to default color
 
-def motta_generate_permutations(first_name: str, last_name: str, domain: str, level: int) -> List[str]:
+# Maximum RCPT TO commands pipelined per MAIL FROM transaction.
+# RFC 5321 only guarantees 100 recipients per message, so we stay at that limit.
+RCPT_BATCH_SIZE = 100
+
+# Stand-in reply for an address the session can't encode (e.g. non-ASCII without SMTPUTF8) - never sent
+UNENCODABLE_REPLY = (553, b"5.1.3 Address cannot be encoded - not sent")
+
+# VRFY replies we trust; anything else (252 "cannot verify", 502 disabled...) falls back to RCPT
+VRFY_VERDICTS = {250: True, 251: True, 550: False, 551: False, 553: False}
+
+# Persistent SMTP sessions - MottaSec Ninjas don't knock twice on the same door
+SMTP_POOL_SIZE = 5                 # Idle sessions kept per MX server
+MAX_EMAILS_PER_CONNECTION = 1000   # Recycle a session after this many RCPT probes
+
+# Spreading the load over several MX servers - MottaSec Fox never relies on one den
+MX_SPREAD = 3                 # Top-preference MX servers that share the work
+MX_THROTTLE_CODES = (421, 450)  # Replies meaning "slow down" or "try again later"
+MX_EJECT_AFTER = 3            # Consecutive throttling replies before an MX is benched
+MX_EJECT_SECONDS = 60         # How long a benched MX is avoided
+
+# Process-wide DNS cache - MottaSec Aces never ask DNS the same question twice
+MX_CACHE_MAXSIZE = 50000   # Answers remembered before the least recently used is evicted
+DNS_TIMEOUT = 2            # Seconds to wait for a single nameserver
+DNS_LIFETIME = 5           # Seconds to spend on a whole lookup, retries included
+
+
+class MottaSMTP(smtplib.SMTP):
+    """
+    SMTP client that can pipeline RCPT TO probes (RFC 2920).
+    
+    MottaSec Ninjas don't wait for an answer before asking the next question:
+    when the server advertises PIPELINING, all RCPT commands of a batch are
+    written back-to-back and the replies are drained afterwards, so a whole
+    batch costs a single round-trip instead of one per address.
+    """
+
+    def __init__(self, host: str = '', port: int = 0, **kwargs):
+        self.motta_mx_server = host
+        self.motta_rcpt_count = 0  # RCPT probes issued over this session's lifetime
+        super().__init__(host, port, **kwargs)
+
+    def motta_greet(self, known: Optional[Tuple[bytes, Dict[str, str]]] = None) -> None:
+        """
+        Send EHLO to learn the server's extensions, falling back to HELO.
+        
+        Args:
+            known: (raw EHLO reply, parsed extensions) from an earlier session with
+                the same server. EHLO is still sent (the protocol requires it), but
+                an identical reply is not parsed again.
+        """
+        if known is not None:
+            code, message = self.docmd("ehlo", "mottasec.com")
+            if code == 250:
+                known_resp, features = known
+                if message == known_resp:
+                    self.ehlo_resp = message
+                    self.does_esmtp = True
+                    self.esmtp_features = dict(features)
+                else:
+                    # Another backend behind the same MX name - it may lack PIPELINING
+                    self._motta_parse_ehlo(message)
+            else:
+                # EHLO was refused on this session; a second one may count as a protocol error
+                self.helo("mottasec.com")
+            return
+
+        code, _ = self.ehlo("mottasec.com")  # MottaSec Fox's calling card
+        if code != 250:
+            self.helo("mottasec.com")
+
+    def _motta_parse_ehlo(self, message: bytes) -> None:
+        """Record a 250 EHLO reply and parse its extensions the way smtplib.ehlo() does."""
+        self.ehlo_resp = message
+        self.does_esmtp = True
+        self.esmtp_features = {}
+        for line in message.decode("latin-1").split("\n")[1:]:
+            match = re.match(r'(?P<feature>[A-Za-z0-9][A-Za-z0-9\-]*) ?', line)
+            if match:
+                feature = match.group("feature").lower()
+                params = line[match.end("feature"):].strip()
+                if feature == "auth":
+                    self.esmtp_features[feature] = self.esmtp_features.get(feature, "") + " " + params
+                else:
+                    self.esmtp_features[feature] = params
+
+    def pipeline_rcpts(self, emails: List[str]) -> List[Tuple[int, bytes]]:
+        """
+        Issue RCPT TO for every address and collect the replies in order.
+        
+        Falls back to plain request/response when the server does not
+        advertise PIPELINING, since some servers choke on queued commands.
+        
+        Args:
+            emails: Email addresses to probe within the current transaction
+            
+        Returns:
+            List of (code, message) replies, one per email; addresses that can't
+            be encoded get UNENCODABLE_REPLY and are never sent
+        """
+        if not self.has_extn("pipelining"):
+            return [self._motta_rcpt(email) for email in emails]
+
+        # Encode one address at a time, so a single bad one can't sink the batch
+        commands = []
+        for email in emails:
+            try:
+                commands.append(b"RCPT TO:<%s>\r\n" % email.encode(self.command_encoding))
+            except UnicodeEncodeError:
+                commands.append(None)
+        sendable = [command for command in commands if command is not None]
+        if not sendable:
+            return [UNENCODABLE_REPLY] * len(emails)
+
+        # One buffer, one sendall() for the whole batch
+        buf = b"".join(sendable)
+        if self.debuglevel > 0:
+            self._print_debug('send:', buf)
+        self.sock.sendall(buf)
+        replies = iter(self._motta_read_replies(len(sendable)))
+        return [UNENCODABLE_REPLY if command is None else next(replies) for command in commands]
+
+    def _motta_rcpt(self, email: str) -> Tuple[int, bytes]:
+        """Plain RCPT TO; smtplib encodes before sending, so a bad address never hits the wire."""
+        try:
+            return self.rcpt(email)
+        except UnicodeEncodeError:
+            return UNENCODABLE_REPLY
+
+    def _motta_read_replies(self, count: int) -> List[Tuple[int, bytes]]:
+        """
+        Drain a known number of replies, reading the socket in 4KB chunks.
+        
+        Replaces one readline() per reply line with a few large reads; multi-line
+        replies ("250-...") are joined like smtplib.getreply() does.
+        
+        Raises:
+            smtplib.SMTPServerDisconnected: If the server hangs up mid-batch
+            smtplib.SMTPException: If the server sends more than was asked for
+        """
+        if self.file is None:
+            self.file = self.sock.makefile('rb')
+
+        replies = []
+        lines = []
+        buffer = bytearray()
+        while len(replies) < count:
+            chunk = self.file.read1(4096)
+            if not chunk:
+                self.close()
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            buffer += chunk
+
+            start = 0
+            while len(replies) < count:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                line = bytes(buffer[start:end]).rstrip(b"\r")
+                start = end + 1
+                lines.append(line[4:].strip(b" \t"))
+                if line[3:4] != b"-":  # Last line of this reply
+                    try:
+                        code = int(line[:3])
+                    except ValueError:
+                        code = -1
+                    replies.append((code, b"\n".join(lines)))
+                    lines = []
+            del buffer[:start]
+
+        if buffer:
+            # Anything left over would desync the session, so refuse to reuse it
+            raise smtplib.SMTPException("Unexpected data after pipelined replies")
+        if self.debuglevel > 0:
+            self._print_debug('reply:', replies)
+        return replies
+
+
+_SMTP_POOL: Dict[str, "queue.Queue[MottaSMTP]"] = {}
+_SMTP_FEATURES: Dict[str, Tuple[bytes, Dict[str, str]]] = {}  # mx_server -> (EHLO reply, extensions) of its first session
+_SMTP_POOL_LOCK = threading.Lock()
+_PRINT_LOCK = threading.Lock()  # Keeps concurrent workers' reports in one piece
+
+def _motta_emit(text: str) -> None:
+    """Write a block of report lines with a single write() and flush."""
+    with _PRINT_LOCK:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+def motta_smtp_acquire(mx_server: str, debug: int = 0, fresh: bool = False) -> MottaSMTP:
+    """
+    Take an idle SMTP session for the MX server from the pool, or open a new one.
+    
+    New sessions are greeted eagerly, so the caller can go straight to MAIL FROM.
+    The first session's EHLO reply and extensions are remembered per MX server;
+    following sessions reuse the extensions when they get the same reply.
+    
+    Args:
+        mx_server: MX server to connect to
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        fresh: Always open a new connection, e.g. to retry after a stale pooled one
+        
+    Returns:
+        A greeted MottaSMTP session
+    """
+    with _SMTP_POOL_LOCK:
+        pool = _SMTP_POOL.setdefault(mx_server, queue.Queue(maxsize=SMTP_POOL_SIZE))
+    if not fresh:
+        try:
+            return pool.get_nowait()
+        except queue.Empty:
+            pass
+
+    if debug >= 1:
+        _motta_emit(f"{BLUE}🔌 Connecting to MX server: {mx_server}...{RESET}\n")
+
+    smtp = MottaSMTP(mx_server, 25, timeout=10)
+    try:
+        if debug == 2:
+            smtp.set_debuglevel(1)
+        smtp.motta_greet(_SMTP_FEATURES.get(mx_server))
+        if smtp.does_esmtp:
+            _SMTP_FEATURES.setdefault(mx_server, (smtp.ehlo_resp, smtp.esmtp_features))
+    except Exception:
+        smtp.close()
+        raise
+    return smtp
+
+def motta_smtp_release(smtp: MottaSMTP, used_count: int) -> None:
+    """
+    Return a session to the pool, or QUIT it once it has served enough probes.
+    
+    Sessions must be released between transactions (after RSET); broken
+    sessions should go to motta_smtp_discard instead.
+    
+    Args:
+        smtp: Session obtained from motta_smtp_acquire
+        used_count: Number of RCPT probes issued since it was acquired
+    """
+    smtp.motta_rcpt_count += used_count
+    pool = _SMTP_POOL.get(smtp.motta_mx_server)
+    if pool is not None and smtp.motta_rcpt_count < MAX_EMAILS_PER_CONNECTION:
+        try:
+            pool.put_nowait(smtp)
+            return
+        except queue.Full:
+            pass
+    motta_smtp_discard(smtp)
+
+def motta_smtp_discard(smtp: MottaSMTP) -> None:
+    """Say goodbye politely, or just hang up if the server is already gone."""
+    try:
+        smtp.quit()
+    except (smtplib.SMTPException, OSError):
+        smtp.close()
+
+def _motta_smtp_drain(pool: "queue.Queue[MottaSMTP]") -> None:
+    """Discard every idle session waiting in one pool."""
+    while True:
+        try:
+            smtp = pool.get_nowait()
+        except queue.Empty:
+            break
+        motta_smtp_discard(smtp)
+
+def motta_smtp_flush(mx_server: str) -> None:
+    """
+    Discard the idle sessions of one MX server.
+    
+    Used after a pooled session turns out dead: the server most likely
+    dropped its idle siblings at the same time.
+    """
+    pool = _SMTP_POOL.get(mx_server)
+    if pool is not None:
+        _motta_smtp_drain(pool)
+
+def motta_smtp_close_all() -> None:
+    """Close every idle pooled session - MottaSec Aces leave no sockets behind."""
+    with _SMTP_POOL_LOCK:
+        pools = list(_SMTP_POOL.values())
+        _SMTP_POOL.clear()
+    for pool in pools:
+        _motta_smtp_drain(pool)
+
+atexit.register(motta_smtp_close_all)
+
+def _motta_probe(emails: List[str], sender_email: str, mx_server: str, debug: int) -> List[Tuple[int, bytes]]:
+    """
+    Run one MAIL FROM transaction with pipelined RCPT TO probes on a pooled session.
+    
+    Args:
+        emails: Email addresses to probe together
+        sender_email: Email to use as MAIL FROM
+        mx_server: MX server to connect to
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        
+    Returns:
+        List of (code, message) RCPT replies, one per email
+        
+    Raises:
+        smtplib.SMTPException, OSError: If the server can't be reached twice in a row
+    """
+    for attempt in range(2):
+        smtp = motta_smtp_acquire(mx_server, debug, fresh=attempt > 0)
+        try:
+            smtp.mail(sender_email)
+            replies = smtp.pipeline_rcpts(emails)
+            smtp.rset()
+            break
+        except Exception:
+            # Never pool a broken session; the single retry dials a new connection,
+            # since the other idle sessions have most likely gone stale too
+            motta_smtp_discard(smtp)
+            if attempt:
+                raise
+            motta_smtp_flush(mx_server)
+    motta_smtp_release(smtp, len(emails))
+
+    if debug >= 1:
+        _motta_emit("".join(f"{BLUE}📨 RCPT TO response for {email}: {response}{RESET}\n"
+                            for email, response in zip(emails, replies)))
+    return replies
+
+
+_DNS_CACHE = dns.resolver.LRUCache(MX_CACHE_MAXSIZE)  # Honors record TTLs
+
+def _motta_configure_resolver(resolver):
+    """Apply MottaHunter's timeouts and the shared answer cache to a resolver."""
+    resolver.timeout = DNS_TIMEOUT
+    resolver.lifetime = DNS_LIFETIME
+    resolver.cache = _DNS_CACHE
+    return resolver
+
+@lru_cache(maxsize=1)
+def _motta_resolver() -> dns.resolver.Resolver:
+    """The process-wide resolver; /etc/resolv.conf is read on first use only."""
+    return _motta_configure_resolver(dns.resolver.Resolver())
+
+def _motta_sorted_mx(answer) -> Tuple[Tuple[str, int], ...]:
+    """Turn an MX answer into (exchange, preference) pairs sorted by preference."""
+    return tuple(sorted(((r.exchange.to_text(), r.preference) for r in answer),
+                        key=lambda record: record[1]))
+
+def motta_resolve_mx(domain: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Resolve the MX records of a domain, using the process-wide DNS cache.
+    
+    Answers are cached by dnspython for their record TTL, so repeated
+    lookups never outlive the data.
+    
+    Args:
+        domain: Domain to look up (case-insensitive)
+        
+    Returns:
+        Tuple of (exchange, preference) pairs sorted by preference
+        
+    Raises:
+        dns.exception.DNSException: If the lookup fails
+    """
+    return _motta_sorted_mx(_motta_resolver().resolve(domain.lower(), 'MX'))
+
+def _motta_usernames_light(fl: str, ll: str, fi: str, li: str, f3: str, l3: str) -> Tuple[str, ...]:
+    """Basic permutations (level 1) - MottaSec Ghost's essentials."""
+    return (f"{fl}{ll}", f"{fl}.{ll}", f"{fi}{ll}", f"{fi}.{ll}", f"{fi}_{ll}", f"{fl}-{ll}")
+
+def _motta_usernames_medium(fl: str, ll: str, fi: str, li: str, f3: str, l3: str) -> Tuple[str, ...]:
+    """Level 1 plus medium permutations - MottaSec Fox's favorites."""
+    return _motta_usernames_light(fl, ll, fi, li, f3, l3) + (
+        fl, ll, f"{fl}_{ll}", f"{ll}.{fl}", f"{ll}_{fl}", f"{ll}{fl}")
+
+def _motta_usernames_heavy(fl: str, ll: str, fi: str, li: str, f3: str, l3: str) -> Tuple[str, ...]:
+    """Level 2 plus heavy permutations - MottaSec Aces' advanced patterns."""
+    return _motta_usernames_medium(fl, ll, fi, li, f3, l3) + (
+        f"{fi}{l3}", f"{fi}.{l3}", f"{f3}{li}", f"{l3}{fi}", f"{fl}{li}", f"{ll}{fi}")
+
+# One specialized builder per level - picked once per call, no level checks while building
+_MOTTA_USERNAME_LEVELS = {
+    1: _motta_usernames_light,
+    2: _motta_usernames_medium,
+    3: _motta_usernames_heavy,
+}
+
+def _motta_usernames(first_name: str, last_name: str, level: int) -> Tuple[str, ...]:
+    """
+    Build the username (local part) candidates for one person, in priority order.
+    
+    Each level is a tuple display of f-strings (6 light, 12 medium, 18 heavy),
+    so the result is allocated at its exact size in one step - no appends,
+    no resizing - before going into the caller's de-duplicating dict.
+    
+    Args:
+        first_name: First name to use in permutations
+        last_name: Last name to use in permutations
+        level: Permutation level (1=light, 2=medium, 3=heavy)
+        
+    Returns:
+        Lowercase usernames, possibly with duplicates
+    """
+    return _motta_lower_usernames(first_name.lower(), last_name.lower(), level)
+
+def _motta_lower_usernames(fl: str, ll: str, level: int) -> Tuple[str, ...]:
+    """Same as _motta_usernames, for names that are already lowercase."""
+    # Levels below 1 get the light set and above 3 the heavy set, as before
+    usernames = _MOTTA_USERNAME_LEVELS[min(max(level, 1), 3)]
+    # Initials and 3-letter prefixes are sliced once and shared by every template
+    return usernames(fl, ll, fl[:1], ll[:1], fl[:3], ll[:3])
+
+def motta_generate_permutations(first_name: str, last_name: str, domain: str, level: int,
+                                as_set: bool = False) -> Union[List[str], Set[str]]:
     """
     Generate email permutations based on the selected level.
     Returns a list of complete email addresses (user@domain).
@@ -37,48 +454,112 @@ def motta_generate_permutations(first_name: str, last_name: str, domain: str, le
         last_name: Last name to use in permutations
         domain: Domain to append to usernames
         level: Permutation level (1=light, 2=medium, 3=heavy)
+        as_set: Return an unordered set for membership checks instead of the ordered list
         
     Returns:
-        List of email address permutations
-    """
-    # Ensure domain is lowercase for consistency
-    domain = domain.lower()
-    
-    # Basic permutations (level 1) - MottaSec Ghost's essentials
-    permutations = [
-        f"{first_name.lower()}{last_name.lower()}@{domain}",
-        f"{first_name.lower()}.{last_name.lower()}@{domain}",
-        f"{first_name[0].lower()}{last_name.lower()}@{domain}",
-        f"{first_name[0].lower()}.{last_name.lower()}@{domain}",
-        f"{first_name[0].lower()}_{last_name.lower()}@{domain}",
-        f"{first_name.lower()}-{last_name.lower()}@{domain}",
-    ]
-    
-    # Add medium level permutations - MottaSec Fox's favorites
-    if level >= 2:
-        permutations.extend([
-            f"{first_name.lower()}@{domain}",
-            f"{last_name.lower()}@{domain}",
-            f"{first_name.lower()}_{last_name.lower()}@{domain}",
-            f"{last_name.lower()}.{first_name.lower()}@{domain}",
-            f"{last_name.lower()}_{first_name.lower()}@{domain}",
-            f"{last_name.lower()}{first_name.lower()}@{domain}",
-        ])
-    
-    # Add heavy level permutations - MottaSec Aces' advanced patterns
-    if level >= 3:
-        permutations.extend([
-            f"{first_name[0].lower()}{last_name[:3].lower()}@{domain}",
-            f"{first_name[0].lower()}.{last_name[:3].lower()}@{domain}",
-            f"{first_name[:3].lower()}{last_name[0].lower()}@{domain}",
-            f"{last_name[:3].lower()}{first_name[0].lower()}@{domain}",
-            f"{first_name.lower()}{last_name[0].lower()}@{domain}",
-            f"{last_name.lower()}{first_name[0].lower()}@{domain}",
-        ])
-    
-    return list(dict.fromkeys(permutations))  # Remove duplicates while preserving order
-
-def motta_validate_email_smtp(email: str, sender_email: str, mx_server: str, debug: int) -> bool:
+        List (or set, with as_set=True) of email address permutations
+    """
+    # Normalize before the cache lookup, so "John"/"john" share one entry
+    permutations = _motta_cached_permutations(first_name.lower(), last_name.lower(), domain.lower(), level)
+    if as_set:
+        return set(permutations)
+    return list(permutations)
+
+@lru_cache(maxsize=4096)
+def _motta_cached_permutations(first_name: str, last_name: str, domain: str, level: int) -> Tuple[str, ...]:
+    """
+    Build the permutations for already-lowercased inputs, once per person and level.
+    
+    A tuple is cached so no caller can mutate the shared copy.
+    """
+    at_domain = "@" + domain
+    
+    # De-duplicate the short local parts first, then append the domain once per unique one
+    unique_usernames = dict.fromkeys(_motta_lower_usernames(first_name, last_name, level))
+    return tuple([username + at_domain for username in unique_usernames])
+
+def motta_count_permutations(first_name: str, last_name: str, level: int) -> int:
+    """
+    Count the unique permutations for one person without building any addresses.
+    
+    Args:
+        first_name: First name to use in permutations
+        last_name: Last name to use in permutations
+        level: Permutation level (1=light, 2=medium, 3=heavy)
+        
+    Returns:
+        Number of addresses motta_generate_permutations would return
+    """
+    return len(set(_motta_usernames(first_name, last_name, level)))
+
+def motta_generate_permutations_range(first_name: str, last_name: str, domain: str, level: int,
+                                      start: int, end: int) -> List[str]:
+    """
+    Generate only the permutations at positions [start, end) of the full list.
+    
+    MottaSec Jedis splitting a hunt into parts build just their own part:
+    usernames are de-duplicated on the fly and only the requested slice
+    ever gets a domain appended.
+    
+    Args:
+        first_name: First name to use in permutations
+        last_name: Last name to use in permutations
+        domain: Domain to append to usernames
+        level: Permutation level (1=light, 2=medium, 3=heavy)
+        start: Index of the first permutation to return
+        end: Index one past the last permutation to return
+        
+    Returns:
+        The same addresses as motta_generate_permutations(...)[start:end]
+    """
+    at_domain = "@" + domain.lower()
+    unique_usernames = dict.fromkeys(_motta_usernames(first_name, last_name, level))
+    return [username + at_domain for username in islice(unique_usernames, start, end)]
+
+def motta_generate_permutations_bulk(names: List[Tuple[str, str]], domain: str, level: int) -> List[str]:
+    """
+    Generate email permutations for a whole roster of people at once.
+    
+    MottaSec Aces hunt entire org charts: all names go through a single
+    comprehension and duplicates are removed once for the whole batch.
+    
+    Args:
+        names: List of (first_name, last_name) pairs
+        domain: Domain to append to usernames
+        level: Permutation level (1=light, 2=medium, 3=heavy)
+        
+    Returns:
+        List of unique email address permutations, grouped by person in input order
+    """
+    at_domain = "@" + domain.lower()
+    return list(dict.fromkeys(username + at_domain
+                              for first_name, last_name in names
+                              for username in _motta_usernames(first_name, last_name, level)))
+
+def _motta_vrfy(email: str, mx_server: str, debug: int) -> Optional[bool]:
+    """
+    Ask the server directly with VRFY, when it advertises support for it.
+    
+    Returns:
+        True/False on a clear answer, None if VRFY is unavailable or ambiguous
+    """
+    smtp = motta_smtp_acquire(mx_server, debug)
+    try:
+        if not smtp.has_extn("vrfy"):
+            motta_smtp_release(smtp, 0)
+            return None
+        code, message = smtp.verify(email)
+    except Exception:
+        motta_smtp_discard(smtp)
+        return None
+    motta_smtp_release(smtp, 1)
+
+    if debug >= 1:
+        _motta_emit(f"{BLUE}📨 VRFY response for {email}: {(code, message)}{RESET}\n")
+    return VRFY_VERDICTS.get(code)
+
+def motta_validate_email_smtp(email: str, sender_email: str, mx_server: str, debug: int,
+                              try_vrfy: bool = False) -> bool:
     """
     Validate an email address via SMTP.
     
@@ -90,26 +571,20 @@ def motta_validate_email_smtp(email: str, sender_email: str, mx_server: str, deb
         sender_email: Email to use as MAIL FROM
         mx_server: MX server to connect to
         debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        try_vrfy: If True, try a one-round-trip VRFY before MAIL FROM/RCPT TO.
+            Off by default since many servers refuse or fake VRFY answers.
         
     Returns:
         True if email exists, False otherwise
     """
     try:
-        if debug >= 1:
-            print(f"{BLUE}🔌 Connecting to MX server: {mx_server}...{RESET}")
-        
-        with smtplib.SMTP(mx_server, 25, timeout=10) as smtp:
-            if debug == 2:
-                smtp.set_debuglevel(1)
+        if try_vrfy:
+            verdict = _motta_vrfy(email, mx_server, debug)
+            if verdict is not None:
+                return verdict
 
-            smtp.helo("mottasec.com")  # MottaSec Fox's calling card
-            smtp.mail(sender_email)
-            response = smtp.rcpt(email)
-
-            if debug >= 1:
-                print(f"{BLUE}📨 RCPT TO response for {email}: {response}{RESET}")
-
-            return response[0] == 250
+        response = _motta_probe([email], sender_email, mx_server, debug)[0]
+        return response[0] == 250
     except Exception as e:
         if debug >= 1:
             print(f"{RED}⚠️ SMTP Error for {email}: {e}{RESET}")
@@ -143,7 +618,22 @@ def motta_validate_info_address(domain: str, sender_email: str, mx_server: str,
 
         # Use custom email if provided, otherwise use info@domain
         test_email = check_email if check_email else f"info@{domain}"
-        result = motta_validate_email_smtp(test_email, sender_email, mx_server, debug)
+
+        # Check for catch-all with a random address - MottaSec Aces' special technique.
+        # Both probes share one session and one MAIL FROM, and are pipelined together.
+        random_string = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz', k=10))
+        random_email = f"mottasec-{random_string}@{domain}"
+        started = time.perf_counter()
+        info_reply, random_reply = _motta_probe([test_email, random_email], sender_email, mx_server, debug)
+        if debug >= 1:
+            print(f"{BLUE}⏱️ MottaSec Fox timed both probes at {(time.perf_counter() - started) * 1000:.0f} ms{RESET}")
+        result = info_reply[0] == 250
+
+        # A server that accepts the random address, or answers both probes with the
+        # exact same positive reply (e.g. 252 "will try"), can't tell users apart.
+        # The second case never changes the outcome - info@ got no 250 there - it
+        # just explains in the report why the hunt stops.
+        is_catch_all = random_reply[0] == 250 or (info_reply == random_reply and 200 <= info_reply[0] < 300)
 
         print("\n")  # Empty line before
         if result:
@@ -152,10 +642,6 @@ def motta_validate_info_address(domain: str, sender_email: str, mx_server: str,
             print(f"{RED}❌ MottaSec Ghost reports: {test_email} is invalid.{RESET}")
         print("\n")  # Empty line after
 
-        # Check for catch-all - MottaSec Aces' special technique
-        random_string = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz', k=10))
-        test_email = f"mottasec-{random_string}@{domain}"
-        is_catch_all = motta_validate_email_smtp(test_email, sender_email, mx_server, debug)
         if is_catch_all:
             print(f"{RED}⚠️ MottaSec Fox Alert: Domain {domain} is a catch-all domain!{RESET}")
         return result, is_catch_all
@@ -164,30 +650,169 @@ def motta_validate_info_address(domain: str, sender_email: str, mx_server: str,
         print(f"{RED}🚨 MottaSec Error validating {test_email}: {e}{RESET}")
         return False, False
 
-def motta_validate_email_permutations(permutations: List[str], domain: str, sender_email: str, 
-                              delay: List[int], debug: int, no_check: bool = False, 
-                              check_email: str = None) -> None:
+_MX_HEALTH: Dict[str, List[float]] = {}  # mx_server -> [consecutive throttles, benched until]
+_MX_HEALTH_LOCK = threading.Lock()
+
+def _motta_mx_record(mx_server: str, code: int) -> None:
+    """Track consecutive throttling replies and bench the MX server when they pile up."""
+    with _MX_HEALTH_LOCK:
+        health = _MX_HEALTH.setdefault(mx_server, [0, 0.0])
+        if code in MX_THROTTLE_CODES:
+            health[0] += 1
+            if health[0] >= MX_EJECT_AFTER:
+                health[0] = 0
+                health[1] = time.monotonic() + MX_EJECT_SECONDS
+        else:
+            health[0] = 0
+
+def _motta_mx_benched(mx_server: str) -> bool:
+    """Return True while the MX server is sitting out after repeated throttling."""
+    with _MX_HEALTH_LOCK:
+        health = _MX_HEALTH.get(mx_server)
+    return bool(health) and health[1] > time.monotonic()
+
+def _motta_mx_rotation(mx_servers: List[str], index: int) -> List[str]:
     """
-    Validate a list of email permutations via SMTP.
+    Order the MX servers for the index-th chunk.
     
-    MottaSec Jedis always validate their findings thoroughly!
+    Consecutive chunks start on different servers among the top MX_SPREAD,
+    the remaining servers follow as fallbacks, and benched servers go last.
+    """
+    spread = mx_servers[:MX_SPREAD]
+    shift = index % len(spread)
+    order = spread[shift:] + spread[:shift] + mx_servers[MX_SPREAD:]
+    return sorted(order, key=_motta_mx_benched)  # Stable sort keeps the rotation
+
+def motta_validate_emails_pipelined(emails: List[str], sender_email: str, mx_servers: List[str],
+                                    debug: int) -> Dict[str, bool]:
+    """
+    Validate many email addresses over a single SMTP session.
+    
+    MottaSec Ninjas knock once: one pooled connection, a single MAIL FROM per
+    batch, then all RCPT TO probes of the batch are pipelined. If a server drops
+    or throttles us (421/450), the affected addresses move on to the next MX server.
     
     Args:
-        permutations: List of complete email addresses to validate
+        emails: List of email addresses to validate
+        sender_email: Email to use as MAIL FROM
+        mx_servers: MX servers to try, in priority order
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        
+    Returns:
+        Dictionary mapping each email to True if it exists, False otherwise
+    """
+    results = {email: False for email in emails}
+    pending = list(emails)
+
+    # Bind hot-loop globals once - LOAD_FAST beats LOAD_GLOBAL on every RCPT reply
+    mx_record, mx_benched, throttle_codes = _motta_mx_record, _motta_mx_benched, MX_THROTTLE_CODES
+
+    for mx_server in mx_servers:
+        deferred = []  # Throttled addresses, left for the next MX server
+        # A pooled session may have gone stale, so each MX gets a single fresh reconnect
+        for attempt in range(2):
+            if not pending:
+                break
+            try:
+                smtp = motta_smtp_acquire(mx_server, debug, fresh=attempt > 0)
+            except Exception as e:
+                _motta_mx_record(mx_server, getattr(e, 'smtp_code', 0))
+                if debug >= 1:
+                    _motta_emit(f"{RED}⚠️ SMTP Error on {mx_server}: {e}{RESET}\n")
+                break
+
+            used_count = 0
+            try:
+                while pending and not mx_benched(mx_server):
+                    batch = pending[:RCPT_BATCH_SIZE]
+                    smtp.mail(sender_email)
+                    log = []
+                    for email, response in zip(batch, smtp.pipeline_rcpts(batch)):
+                        code = response[0]
+                        if debug >= 1:
+                            log.append(f"{BLUE}📨 RCPT TO response for {email}: {response}{RESET}\n")
+                        mx_record(mx_server, code)
+                        if code in throttle_codes:
+                            deferred.append(email)
+                        else:
+                            results[email] = code == 250
+                    if log:
+                        _motta_emit("".join(log))
+                    # Every reply is in, so the batch is done even if RSET fails
+                    used_count += len(batch)
+                    del pending[:len(batch)]
+                    smtp.rset()  # Reuse the session for the next batch
+            except Exception as e:
+                _motta_mx_record(mx_server, getattr(e, 'smtp_code', 0))
+                if debug >= 1:
+                    _motta_emit(f"{RED}⚠️ SMTP Error on {mx_server}: {e}{RESET}\n")
+                motta_smtp_discard(smtp)
+                motta_smtp_flush(mx_server)  # Its idle siblings are likely just as dead
+                continue
+            motta_smtp_release(smtp, used_count)
+            break
+        pending = deferred + pending
+
+    return results
+
+def _motta_validate_chunk(index: int, chunk: List[str], sender_email: str, mx_servers: List[str],
+                          delay: List[int], debug: int, concurrency: int, hunter: str, verb: str) -> int:
+    """
+    Worker body: validate one chunk over a pooled session and report the results.
+    
+    Every worker waits before all but its first chunk, so the stealth delay
+    spaces out each worker's own requests without serializing the workers.
+    
+    Returns:
+        Number of valid emails in the chunk
+    """
+    if index >= concurrency and delay:
+        delay_duration = random.uniform(*delay)
+        _motta_emit(f"{BLUE}⏱️ MottaSec {hunter} is waiting for {delay_duration:.2f} seconds at {time.strftime('%Y-%m-%d %H:%M:%S')}...{RESET}\n")
+        time.sleep(delay_duration)
+
+    results = motta_validate_emails_pipelined(chunk, sender_email, _motta_mx_rotation(mx_servers, index), debug)
+
+    # Build the whole chunk report first, then write it in one go
+    valid_count = 0
+    out = io.StringIO()
+    for email in chunk:
+        out.write("\n\n")  # Add empty lines for readability
+        if results[email]:
+            valid_count += 1
+            out.write(f"{GREEN}✅ MottaSec {hunter} {verb}: {email} is valid.{RESET}\n")
+        else:
+            out.write(f"{RED}❌ MottaSec Ghost reports: {email} is invalid.{RESET}\n")
+        out.write("\n\n")
+    _motta_emit(out.getvalue())
+    return valid_count
+
+def _motta_validate_list(emails: List[str], domain: str, sender_email: str, delay: List[int],
+                         debug: int, no_check: bool, check_email: str, concurrency: int,
+                         hunter: str, verb: str) -> None:
+    """
+    Shared validation loop behind the permutation and scraped-email validators.
+    
+    Args:
+        emails: List of email addresses to validate
         domain: Domain for MX lookup
         sender_email: Email to use as MAIL FROM
-        delay: List of [min, max] delay in seconds
+        delay: List of [min, max] delay in seconds between RCPT batches
         debug: Debug level (0=minimal, 1=moderate, 2=verbose)
         no_check: If True, skip checking default email
         check_email: Custom email to check instead of info@domain
+        concurrency: Number of parallel SMTP workers
+        hunter: MottaSec persona reporting the results
+        verb: Verb used when reporting a valid email
     """
     try:
-        mx_records = resolve(domain, 'MX')
+        mx_records = motta_resolve_mx(domain)
         if not mx_records:
             print(f"{RED}🚨 MottaSec Fox Alert: No MX records found for {domain}{RESET}")
             return
-            
-        mx_server = mx_records[0].exchange.to_text()
+
+        mx_servers = [exchange for exchange, _ in mx_records]
+        mx_server = mx_servers[0]
         if debug >= 1:
             print(f"{BLUE}🔍 MottaSec Fox found MX server: {mx_server}{RESET}")
 
@@ -198,34 +823,49 @@ def motta_validate_email_permutations(permutations: List[str], domain: str, send
         if not info_valid or is_catch_all:
             return
 
-        # Validate each permutation - MottaSec Fox's hunting ground
-        valid_count = 0
-        for email in permutations:
-            is_valid = motta_validate_email_smtp(email, sender_email, mx_server, debug)
+        # Spread the list over the workers - MottaSec Fox's hunting pack
+        concurrency = max(1, concurrency)
+        chunk_size = max(1, min(RCPT_BATCH_SIZE, math.ceil(len(emails) / concurrency)))
+        chunks = [emails[i:i + chunk_size] for i in range(0, len(emails), chunk_size)]
 
-            # Add empty lines for readability
-            print("\n")
-            if is_valid:
-                valid_count += 1
-                print(f"{GREEN}✅ MottaSec Fox found: {email} is valid.{RESET}")
-            else:
-                print(f"{RED}❌ MottaSec Ghost reports: {email} is invalid.{RESET}")
-            print("\n")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(_motta_validate_chunk, index, chunk, sender_email, mx_servers,
+                                delay, debug, concurrency, hunter, verb)
+                for index, chunk in enumerate(chunks)
+            ]
+            valid_count = sum(future.result() for future in futures)
 
-            # Add delay with timestamp - MottaSec Ninja stealth technique
-            delay_duration = random.uniform(*delay)
-            print(f"{BLUE}⏱️ MottaSec Fox is waiting for {delay_duration:.2f} seconds at {time.strftime('%Y-%m-%d %H:%M:%S')}...{RESET}")
-            time.sleep(delay_duration)
-            
         # Summary - MottaSec Aces like good reports
-        print(f"\n{BLUE}📊 MottaSec Summary: Found {valid_count} valid email(s) out of {len(permutations)} tested.{RESET}")
+        print(f"\n{BLUE}📊 MottaSec Summary: Found {valid_count} valid email(s) out of {len(emails)} tested.{RESET}")
 
     except Exception as e:
         print(f"{RED}🚨 MottaSec Error: Failed to retrieve MX server for {domain}: {e}{RESET}")
 
+def motta_validate_email_permutations(permutations: List[str], domain: str, sender_email: str, 
+                              delay: List[int], debug: int, no_check: bool = False, 
+                              check_email: str = None, concurrency: int = 1) -> None:
+    """
+    Validate a list of email permutations via SMTP.
+    
+    MottaSec Jedis always validate their findings thoroughly!
+    
+    Args:
+        permutations: List of complete email addresses to validate
+        domain: Domain for MX lookup
+        sender_email: Email to use as MAIL FROM
+        delay: List of [min, max] delay in seconds between RCPT batches
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        no_check: If True, skip checking default email
+        check_email: Custom email to check instead of info@domain
+        concurrency: Number of parallel SMTP workers (default 1)
+    """
+    _motta_validate_list(permutations, domain, sender_email, delay, debug,
+                         no_check, check_email, concurrency, hunter="Fox", verb="found")
+
 def motta_validate_scraped_emails(emails: List[str], domain: str, sender_email: str, 
                           delay: List[int], debug: int, no_check: bool = False, 
-                          check_email: str = None) -> None:
+                          check_email: str = None, concurrency: int = 1) -> None:
     """
     Validate a list of scraped emails via SMTP.
     
@@ -235,52 +875,14 @@ def motta_validate_scraped_emails(emails: List[str], domain: str, sender_email:
         emails: List of email addresses to validate
         domain: Domain for MX lookup
         sender_email: Email to use as MAIL FROM
-        delay: List of [min, max] delay in seconds
+        delay: List of [min, max] delay in seconds between RCPT batches
         debug: Debug level (0=minimal, 1=moderate, 2=verbose)
         no_check: If True, skip checking default email
         check_email: Custom email to check instead of info@domain
+        concurrency: Number of parallel SMTP workers (default 1)
     """
-    try:
-        mx_records = resolve(domain, 'MX')
-        if not mx_records:
-            print(f"{RED}🚨 MottaSec Fox Alert: No MX records found for {domain}{RESET}")
-            return
-            
-        mx_server = mx_records[0].exchange.to_text()
-        if debug >= 1:
-            print(f"{BLUE}🔍 MottaSec Fox found MX server: {mx_server}{RESET}")
-
-        # Validate info@domain and check catch-all
-        info_valid, is_catch_all = motta_validate_info_address(
-            domain, sender_email, mx_server, debug, no_check, check_email
-        )
-        if not info_valid or is_catch_all:
-            return
-
-        # Validate each email - MottaSec Ghost's verification process
-        valid_count = 0
-        for email in emails:
-            is_valid = motta_validate_email_smtp(email, sender_email, mx_server, debug)
-
-            # Add empty lines for readability
-            print("\n")
-            if is_valid:
-                valid_count += 1
-                print(f"{GREEN}✅ MottaSec Ghost confirms: {email} is valid.{RESET}")
-            else:
-                print(f"{RED}❌ MottaSec Ghost reports: {email} is invalid.{RESET}")
-            print("\n")
-
-            # Add delay with timestamp - MottaSec Ninja stealth technique
-            delay_duration = random.uniform(*delay)
-            print(f"{BLUE}⏱️ MottaSec Ghost is waiting for {delay_duration:.2f} seconds at {time.strftime('%Y-%m-%d %H:%M:%S')}...{RESET}")
-            time.sleep(delay_duration)
-            
-        # Summary - MottaSec Aces like good reports
-        print(f"\n{BLUE}📊 MottaSec Summary: Found {valid_count} valid email(s) out of {len(emails)} tested.{RESET}")
-
-    except Exception as e:
-        print(f"{RED}🚨 MottaSec Error: Failed to retrieve MX server for {domain}: {e}{RESET}")
+    _motta_validate_list(emails, domain, sender_email, delay, debug,
+                         no_check, check_email, concurrency, hunter="Ghost", verb="confirms")
 
 # Aliases for backward compatibility
 generate_permutations = motta_generate_permutations
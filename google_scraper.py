@@ -12,12 +12,18 @@ Website: https://mottasec.com
 Contact: ghost@mottasec.com
 """
 
+import html
 import re
+import sys
 import requests
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from fake_useragent import UserAgent
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from motta_logging import SUCCESS, motta_get_logger
 
 # ANSI color codes for terminal - MottaSec style!
 GREEN = "\033[92m"  # Success - MottaSec Fox approved
@@ -25,15 +31,135 @@ RED = "\033[91m"    # Failure - MottaSec Ghost says no
 BLUE = "\033[94m"   # Info - MottaSec Aces intel
 RESET = "\033[0m"   # Reset to default color
 
-def motta_google_hunt(domain, debug=0, pages=1):
+log = motta_get_logger("google")  # MottaSec field reports, queued once main() starts logging
+
+# Disguises used when fake-useragent has no data - MottaSec Fox's emergency wardrobe
+_FALLBACK_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0",
+)
+
+# Google pages fetched at the same time - MottaSec Fox hunts in pairs, not packs
+GOOGLE_MAX_PARALLEL = 2
+
+# One keep-alive session for every Google page - MottaSec Fox shakes hands only once
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Language": "en-US,en;q=0.9"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # Retry only flaky gateways; a 429 means Google wants fewer requests, so it goes
+    # straight back to the "blocked" branch, and a last bad status is returned, not raised
+    max_retries=Retry(total=2, backoff_factor=1.5, status_forcelist=[502, 503], raise_on_status=False)
+))
+
+@lru_cache(maxsize=1)
+def _motta_user_agents():
     """
-    Hunt through Google search results for potential emails related to the domain.
+    Load desktop Chrome and Firefox User-Agent strings once per process.
+    
+    Handles both fake-useragent data layouts (dict of lists before 1.0,
+    list of records since) and falls back to a built-in list on any error.
+    """
+    try:
+        data = UserAgent().data_browsers
+        if isinstance(data, dict):
+            agents = [agent for name in ("chrome", "firefox") for agent in data.get(name, [])]
+        else:
+            agents = [entry["useragent"] for entry in data
+                      if entry.get("type") == "desktop" and entry.get("browser") in ("Chrome", "Firefox")]
+        if agents:
+            return tuple(agents)
+    except Exception:
+        pass
+    return _FALLBACK_USER_AGENTS
+
+@lru_cache(maxsize=256)
+def _email_pat(domain):
+    """Compile (once per domain) the regex matching emails ending with the domain."""
+    return re.compile(r"[a-zA-Z0-9._%+-]+@" + re.escape(domain), re.IGNORECASE)
+
+def _motta_show_title(page_html):
+    """Print the page title so a CAPTCHA page is easy to spot (needs BeautifulSoup)."""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        return
+    title = BeautifulSoup(page_html, 'html.parser').title
+    log.info("📄 MottaSec Aces see page: %s", title.get_text() if title else 'untitled')
+
+def _motta_fetch_page(domain, page, user_agents, debug):
+    """
+    Fetch one Google results page after a random stealth delay.
+    
+    Each worker waits on its own, so pages fetched in parallel are still
+    spaced out from the point of view of every single connection.
+    
+    Args:
+        domain: The domain to search for emails
+        page: Zero-based results page number
+        user_agents: Tuple of User-Agent strings to pick a disguise from
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        
+    Returns:
+        The page HTML, or None if Google refused to serve it or the request failed
+    """
+    start = page * 10  # Each Google page has 10 results
+    
+    # MottaSec Fox's favorite search queries
+    queries = [
+        f"site:{domain} email OR contact OR mailto",
+        f"site:{domain} email",
+        f"site:{domain} contact us"
+    ]
+    
+    # Use a different query for each page for better results
+    query = queries[page % len(queries)]
+    url = f"https://www.google.com/search?q={query}&start={start}"
+
+    # Randomize User-Agent - MottaSec Ninja stealth technique
+    headers = {
+        "User-Agent": random.choice(user_agents)
+    }
+
+    if debug >= 1:
+        log.info("🔍 MottaSec Fox is searching: %s", url)
+        log.info("🥸 Using disguise: %s", headers['User-Agent'])
+
+    # Add a random delay between 2 and 5 seconds - MottaSec Ghost's patience
+    delay = random.uniform(2, 5)
+    if debug >= 2:
+        log.info("⏱️ MottaSec Fox is waiting for %.2f seconds before pouncing...", delay)
+    time.sleep(delay)
+
+    # Make the request - MottaSec Fox's hunt begins. A failed page is skipped,
+    # so it can't take the pages fetched beside it down too.
+    try:
+        response = _SESSION.get(url, headers=headers, timeout=10)
+    except requests.RequestException as e:
+        log.error("🚨 MottaSec Fox lost page %d: %s", page + 1, e)
+        return None
+    if debug >= 1:
+        log.info("📡 Google hunt response: %s", response.status_code)
+
+    # Check for successful response
+    if response.status_code != 200:
+        log.warning("⚠️ MottaSec Fox was blocked: HTTP %s", response.status_code)
+        return None
+    return response.text
+
+def motta_google_hunt_stream(domain, debug=0, pages=1):
+    """
+    Hunt through Google search results, yielding each new email as its page is scanned.
     
     MottaSec Fox's favorite hunting ground is Google - so much information
     just waiting to be discovered with the right search queries!
     
     Features:
-    - Supports pagination across multiple result pages
+    - Supports pagination across multiple result pages, fetched in parallel
     - Uses random delays to avoid detection
     - Randomizes User-Agent headers for stealth
     - Focuses on domain-specific email patterns
@@ -43,70 +169,55 @@ def motta_google_hunt(domain, debug=0, pages=1):
         debug: Debug level (0=minimal, 1=moderate, 2=verbose)
         pages: Number of Google search pages to process
         
-    Returns:
-        List of unique email addresses found
+    Yields:
+        Unique lowercase email addresses, in discovery order
     """
     emails = set()
-    ua = UserAgent()  # Initialize the UserAgent for randomization - MottaSec Fox's disguise
+    user_agents = _motta_user_agents()  # MottaSec Fox's wardrobe of disguises
+    email_pat = _email_pat(domain)  # Match only emails ending with the domain
 
     try:
-        for page in range(pages):
-            start = page * 10  # Each Google page has 10 results
-            
-            # MottaSec Fox's favorite search queries
-            queries = [
-                f"site:{domain} email OR contact OR mailto",
-                f"site:{domain} email",
-                f"site:{domain} contact us"
-            ]
-            
-            # Use a different query for each page for better results
-            query = queries[page % len(queries)]
-            url = f"https://www.google.com/search?q={query}&start={start}"
-
-            # Randomize User-Agent - MottaSec Ninja stealth technique
-            headers = {
-                "User-Agent": ua.random
-            }
-
-            if debug >= 1:
-                print(f"{BLUE}🔍 MottaSec Fox is searching: {url}{RESET}")
-                print(f"{BLUE}🥸 Using disguise: {headers['User-Agent']}{RESET}")
-
-            # Add a random delay between 2 and 5 seconds - MottaSec Ghost's patience
-            delay = random.uniform(2, 5)
-            if debug >= 2:
-                print(f"{BLUE}⏱️ MottaSec Fox is waiting for {delay:.2f} seconds before pouncing...{RESET}")
-            time.sleep(delay)
-
-            # Make the request - MottaSec Fox's hunt begins
-            response = requests.get(url, headers=headers)
-            if debug >= 1:
-                print(f"{BLUE}📡 Google hunt response: {response.status_code}{RESET}")
-
-            # Check for successful response
-            if response.status_code != 200:
-                print(f"{RED}⚠️ MottaSec Fox was blocked: HTTP {response.status_code}{RESET}")
-                continue
-
-            # Parse the HTML using BeautifulSoup - MottaSec Aces' analysis
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Extract text and filter valid emails using regex - MottaSec Ghost's specialty
-            email_regex = r"[a-zA-Z0-9._%+-]+@" + re.escape(domain)  # Match only emails ending with the domain
-            for text in soup.stripped_strings:
-                matches = re.findall(email_regex, text)
-                if matches and debug >= 2:
-                    print(f"{GREEN}🎯 MottaSec Fox found: {matches}{RESET}")
-                emails.update(matches)
+        # Fetch pages side by side; results are scanned in page order
+        with ThreadPoolExecutor(max_workers=GOOGLE_MAX_PARALLEL) as executor:
+            pages_html = executor.map(lambda page: _motta_fetch_page(domain, page, user_agents, debug), range(pages))
+
+            for page_html in pages_html:
+                if page_html is None:
+                    continue
+
+                # Scan the raw HTML in one pass - MottaSec Ghost's specialty.
+                # Unescaping first also catches obfuscated addresses like info&#64;domain.
+                matches = email_pat.findall(html.unescape(page_html))
+                if debug >= 2:
+                    _motta_show_title(page_html)
+                    if matches:
+                        log.log(SUCCESS, "🎯 MottaSec Fox found: %s", matches)
+                # Lowercase to merge Info@ and info@, intern so repeats share one string
+                for match in matches:
+                    email = sys.intern(match.lower())
+                    if email not in emails:
+                        emails.add(email)
+                        yield email
 
         if debug >= 1:
-            print(f"{BLUE}📊 MottaSec Fox's hunt summary: Found {len(emails)} unique email(s) on Google{RESET}")
-        return list(emails)
+            log.info("📊 MottaSec Fox's hunt summary: Found %d unique email(s) on Google", len(emails))
 
     except Exception as e:
-        print(f"{RED}🚨 MottaSec Fox encountered an error during Google hunting: {e}{RESET}")
-        return []
+        log.error("🚨 MottaSec Fox encountered an error during Google hunting: %s", e)
+
+def motta_google_hunt(domain, debug=0, pages=1):
+    """
+    Hunt through Google search results for potential emails related to the domain.
+    
+    Args:
+        domain: The domain to search for emails
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        pages: Number of Google search pages to process
+        
+    Returns:
+        List of unique email addresses found
+    """
+    return list(motta_google_hunt_stream(domain, debug, pages))
 
 # Alias for backward compatibility
 scrape_google = motta_google_hunt
\ No newline at end of file
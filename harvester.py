@@ -15,18 +15,38 @@ Contact: ghost@mottasec.com
 """
 
 import argparse
-import random
+import asyncio
 import time
 import sys
 import csv
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Set, List, Tuple
+from typing import List, Set, Tuple
 from email_validation import validate_email_permutations, validate_scraped_emails, generate_permutations
-from google_scraper import scrape_google
-from twitter_scraper import scrape_twitter
-from linkedin_scraper import scrape_linkedin
+from email_validation import motta_count_permutations, motta_generate_permutations_range
+from google_scraper import motta_google_hunt_stream
+from twitter_scraper import motta_twitter_hunt_stream
+from linkedin_scraper import motta_linkedin_hunt_stream
 from dotenv import load_dotenv
-from unittest.mock import MagicMock
+from motta_logging import motta_start_logging
+
+
+# MottaSec Fox banner, shown when a mission starts
+MOTTA_BANNER = """
+        ╔═══════════════════════════════════════════════╗
+        ║  🦊 MottaHunter - Email Reconnaissance Tool   ║
+        ║      Developed with ❤️ by MottaSec Jedis      ║
+        ╚═══════════════════════════════════════════════╝
+        """
+
+
+@lru_cache(maxsize=1)
+def _motta_ensure_env():
+    """Read .env once per process, however many hunters get created."""
+    load_dotenv()
 
 
 class MottaHunter:
@@ -37,18 +57,22 @@ class MottaHunter:
     This class handles scraping from various sources and validating the results.
     """
     
+    # Everything __init__ assigns - no per-instance __dict__
+    __slots__ = ('args', 'emails', '_stop')
+    
     def __init__(self, args):
         """Initialize the MottaHunter with command line arguments."""
         self.args = args
         self.emails: Set[str] = set()
-        load_dotenv()
+        self._stop = threading.Event()  # Set on Ctrl-C - the sources stop at their next email
+        _motta_ensure_env()
         
         # MottaSec Fox likes to greet users - but we'll skip this in test mode
         # Debug greeting will be handled in actual command execution, not during initialization
 
     def hunt_for_emails(self) -> Set[str]:
         """
-        Hunt for emails across all enabled sources with proper rate limiting.
+        Hunt for emails across all enabled sources at once.
         
         Returns:
             Set of discovered email addresses
@@ -61,32 +85,28 @@ class MottaHunter:
         except (TypeError, AttributeError):
             pass
         
-        if hasattr(self.args, 'google') and self.args.google:
-            try:
-                print("\n=== 🔍 MottaSec Fox is sniffing Google... ===")
-                google_emails = scrape_google(self.args.domain, pages=self.args.pages, debug=self.args.debug)
-                self.emails.update(google_emails)
-                self._motta_pause()  # MottaSec Jedis always practice patience
-            except Exception as e:
-                print(f"🚫 Error during Google hunting: {e}")
-
-        if hasattr(self.args, 'twitter') and self.args.twitter:
-            try:
-                print("\n=== 🐦 MottaSec Ghost is haunting Twitter... ===")
-                twitter_emails = scrape_twitter(self.args.domain, debug=self.args.debug)
-                self.emails.update(twitter_emails)
-                self._motta_pause()
-            except Exception as e:
-                print(f"🚫 Error during Twitter hunting: {e}")
-
-        if hasattr(self.args, 'linkedin') and self.args.linkedin:
-            try:
-                print("\n=== 💼 MottaSec Aces are infiltrating LinkedIn... ===")
-                linkedin_emails = scrape_linkedin(self.args.domain, debug=self.args.debug)
-                self.emails.update(linkedin_emails)
-                self._motta_pause()
-            except Exception as e:
-                print(f"🚫 Error during LinkedIn hunting: {e}")
+        # (source, banner, scraper, extra kwargs) for every enabled source
+        hunts = []
+        if getattr(self.args, 'google', False):
+            hunts.append(("Google", "\n=== 🔍 MottaSec Fox is sniffing Google... ===",
+                          motta_google_hunt_stream, {'pages': self.args.pages}))
+        if getattr(self.args, 'twitter', False):
+            hunts.append(("Twitter", "\n=== 🐦 MottaSec Ghost is haunting Twitter... ===",
+                          motta_twitter_hunt_stream, {}))
+        if getattr(self.args, 'linkedin', False):
+            hunts.append(("LinkedIn", "\n=== 💼 MottaSec Aces are infiltrating LinkedIn... ===",
+                          motta_linkedin_hunt_stream, {}))
+
+        # The sources live on different hosts, so MottaSec hunts them all at once;
+        # each one streams its finds straight into self.emails
+        try:
+            results = asyncio.run(self._motta_hunt_all(hunts))
+        except KeyboardInterrupt:
+            self._stop.set()
+            raise
+        for (source, _, _, _), result in zip(hunts, results):
+            if isinstance(result, Exception):
+                print(f"🚫 Error during {source} hunting: {result}")
 
         # Save hunted emails to file if any were found
         if self.emails:
@@ -94,6 +114,78 @@ class MottaHunter:
 
         return self.emails
 
+    async def _motta_hunt_all(self, hunts: List[Tuple]) -> List:
+        """
+        Run every enabled source in its own worker thread and wait for all of them.
+        
+        The workers are daemon threads, so Ctrl-C reaches main() right away
+        instead of waiting for a scraper stuck in a rate-limit sleep.
+        
+        Args:
+            hunts: (source, banner, scraper, extra kwargs) tuples
+            
+        Returns:
+            Each source's email count, or the exception it raised, in the same order
+        """
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            *(self._motta_in_daemon(loop, partial(self._motta_hunt_source, banner, scrape, **kwargs))
+              for _, banner, scrape, kwargs in hunts),
+            return_exceptions=True
+        )
+
+    @staticmethod
+    def _motta_in_daemon(loop: asyncio.AbstractEventLoop, func) -> asyncio.Future:
+        """
+        Run func on a daemon thread and return a future for its result.
+        
+        Unlike run_in_executor, nothing joins the thread on the way out.
+        """
+        future = loop.create_future()
+
+        def settle(result, error):
+            if not future.done():  # Already cancelled by Ctrl-C
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+
+        def worker():
+            try:
+                outcome = (func(), None)
+            except Exception as e:
+                outcome = (None, e)
+            try:
+                loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:
+                pass  # The loop is closed - nobody is waiting any more
+
+        threading.Thread(target=worker, daemon=True).start()
+        return future
+
+    def _motta_hunt_source(self, banner: str, scrape, **kwargs) -> int:
+        """
+        Hunt one source, adding each email to self.emails as it arrives.
+        
+        Each scraper paces its own requests; the sources live on different
+        hosts, so there is nothing to wait for between them.
+        
+        Args:
+            banner: Heading printed when the source starts
+            scrape: Streaming scraper taking (domain, debug=..., **kwargs) and yielding emails
+            
+        Returns:
+            Number of emails the source yielded
+        """
+        print(banner)
+        found = 0
+        for email in scrape(self.args.domain, debug=self.args.debug, **kwargs):
+            if self._stop.is_set():
+                break  # Closes the stream, so the scraper stops fetching
+            self.emails.add(email)  # set.add is atomic, so workers can share the set
+            found += 1
+        return found
+
     def validate_targets(self) -> None:
         """
         Validate hunted emails and/or generated email permutations.
@@ -106,36 +198,44 @@ class MottaHunter:
         print("\n=== ✅ MottaSec validation ritual beginning... ===")
         
         # Handle permutation validation
-        if hasattr(self.args, 'first_name') and hasattr(self.args, 'last_name'):
-            if self.args.first_name and self.args.last_name:
-                print("\n🧙‍♂️ MottaSec Jedi is generating email permutations...")
-                all_permutations = generate_permutations(
+        if getattr(self.args, 'first_name', None) and getattr(self.args, 'last_name', None):
+            print("\n🧙‍♂️ MottaSec Jedi is generating email permutations...")
+            
+            # If part specified, generate only that part
+            if getattr(self.args, 'part', None):
+                total_parts = self.args.total_parts
+                selected_part = self.args.part
+                total = motta_count_permutations(self.args.first_name, self.args.last_name, self.args.level)
+                start_idx, end_idx = self._motta_part_bounds(total, total_parts, selected_part)
+                permutations = motta_generate_permutations_range(
                     self.args.first_name,
                     self.args.last_name,
                     self.args.domain,
-                    self.args.level
+                    self.args.level,
+                    start_idx,
+                    end_idx
                 )
-                
-                # If part specified, split permutations
-                if hasattr(self.args, 'part') and self.args.part:
-                    total_parts = self.args.total_parts
-                    selected_part = self.args.part
-                    permutations = self._motta_split(all_permutations, total_parts, selected_part)
-                    print(f"\n🔢 Using part {selected_part} of {total_parts} ({len(permutations)} permutations)")
-                else:
-                    permutations = all_permutations
-
-                print("\n🔍 MottaSec Fox is validating email permutations:")
-                validate_email_permutations(
-                    permutations=permutations,
-                    domain=self.args.domain,
-                    sender_email=self.args.sender_email,
-                    delay=self.args.delay,
-                    debug=self.args.debug,
-                    no_check=hasattr(self.args, 'no_check') and self.args.no_check,
-                    check_email=getattr(self.args, 'check_email', None)
+                print(f"\n🔢 Using part {selected_part} of {total_parts} ({len(permutations)} permutations)")
+            else:
+                permutations = generate_permutations(
+                    self.args.first_name,
+                    self.args.last_name,
+                    self.args.domain,
+                    self.args.level
                 )
 
+            print("\n🔍 MottaSec Fox is validating email permutations:")
+            validate_email_permutations(
+                permutations=permutations,
+                domain=self.args.domain,
+                sender_email=self.args.sender_email,
+                delay=self.args.delay,
+                debug=self.args.debug,
+                no_check=getattr(self.args, 'no_check', False),
+                check_email=getattr(self.args, 'check_email', None),
+                concurrency=getattr(self.args, 'concurrency', 1)
+            )
+
         # Validate hunted emails if any
         if self.emails:
             print("\n👻 MottaSec Ghost is validating hunted emails:")
@@ -145,63 +245,30 @@ class MottaHunter:
                 self.args.sender_email,
                 self.args.delay,
                 self.args.debug,
-                no_check=hasattr(self.args, 'no_check') and self.args.no_check,
-                check_email=getattr(self.args, 'check_email', None)
+                no_check=getattr(self.args, 'no_check', False),
+                check_email=getattr(self.args, 'check_email', None),
+                concurrency=getattr(self.args, 'concurrency', 1)
             )
 
-    def _motta_split(self, permutations: List[str], total_parts: int, selected_part: int) -> List[str]:
+    @staticmethod
+    def _motta_part_bounds(total: int, total_parts: int, selected_part: int) -> Tuple[int, int]:
         """
-        Split permutations into parts and return the selected part.
+        Work out the [start, end) indices of one part - earlier parts take the remainder.
         
-        MottaSec Fox knows that dividing the hunt makes it more effective!
-        
-        Args:
-            permutations: List of email permutations
-            total_parts: Number of parts to split into
-            selected_part: Which part to return (1-based)
-            
-        Returns:
-            List of permutations for the selected part
+        Raises:
+            ValueError: If the selected part is out of range
         """
         if not 1 <= selected_part <= total_parts:
             raise ValueError(f"Part must be between 1 and {total_parts}")
             
-        # Calculate the size of each part
-        part_size = len(permutations) // total_parts
-        remainder = len(permutations) % total_parts
+        # Size of each part, and how many leading parts take one extra
+        part_size, remainder = divmod(total, total_parts)
+        index = selected_part - 1
         
         # Calculate start and end indices for the selected part
-        start_idx = (selected_part - 1) * part_size + min(selected_part - 1, remainder)
-        end_idx = start_idx + part_size + (1 if selected_part <= remainder else 0)
-        
-        return permutations[start_idx:end_idx]
-
-    def _motta_pause(self) -> None:
-        """
-        Apply rate limiting between operations.
-        
-        MottaSec Ninjas know the value of patience and stealth.
-        """
-        # Get delay values, handling both regular values and MagicMock objects
-        try:
-            delay_min = self.args.delay[0]
-            delay_max = self.args.delay[1]
-            delay = random.uniform(delay_min, delay_max)
-        except (TypeError, AttributeError):
-            # Default delay if we're in test mode with MagicMock
-            delay = 0.1
-        
-        # Only print debug messages if we're not in test mode
-        try:
-            debug_level = self.args.debug
-            if isinstance(debug_level, int) and debug_level > 0:
-                print(f"\n⏱️ MottaSec stealth pause: {delay:.2f} seconds...")
-        except (TypeError, AttributeError):
-            pass
-            
-        # Only actually sleep if we're not in test mode
-        if delay > 0 and not isinstance(self.args, MagicMock):
-            time.sleep(delay)
+        start_idx = index * part_size + min(index, remainder)
+        end_idx = start_idx + part_size + (index < remainder)
+        return start_idx, end_idx
 
     def _preserve_findings(self) -> None:
         """
@@ -213,30 +280,49 @@ class MottaHunter:
         output_dir = Path("motta_findings")
         output_dir.mkdir(exist_ok=True)
 
-        # Generate filenames with timestamp
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        # Generate filenames with timestamp - one clock reading for every stamp
+        now = time.localtime()
+        timestamp = time.strftime("%Y%m%d_%H%M%S", now)
         base_filename = f"{self.args.domain}_{timestamp}"
         
-        # Save as TXT
+        # Sort once - both files share the order
+        sorted_emails = sorted(self.emails)
+        domain = self.args.domain
         txt_path = output_dir / f"{base_filename}.txt"
-        with open(txt_path, 'w') as f:
-            f.write(f"# MottaHunter findings for {self.args.domain}\n")
-            f.write(f"# Generated by MottaSec Fox on {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            for email in sorted(self.emails):
-                f.write(f"{email}\n")
-
-        # Save as CSV
         csv_path = output_dir / f"{base_filename}.csv"
-        with open(csv_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Email', 'Domain', 'Discovery_Date'])  # Header
-            for email in sorted(self.emails):
-                writer.writerow([email, self.args.domain, time.strftime('%Y-%m-%d')])
+        
+        # Encoding is the CPU-heavy part, so the two files are written side by side
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            writers = [
+                pool.submit(self._motta_write_txt, txt_path, domain, sorted_emails,
+                            time.strftime('%Y-%m-%d %H:%M:%S', now)),
+                pool.submit(self._motta_write_csv, csv_path, domain, sorted_emails,
+                            time.strftime('%Y-%m-%d', now)),
+            ]
+            for writer in writers:
+                writer.result()  # Surface any write error
 
         print(f"\n📁 MottaSec findings preserved at:")
         print(f"- {txt_path}")
         print(f"- {csv_path}")
 
+    @staticmethod
+    def _motta_write_txt(txt_path: Path, domain: str, sorted_emails: List[str], generated_at: str) -> None:
+        """Write the TXT findings: a short header, then one email per line."""
+        with open(txt_path, 'w', buffering=1 << 20) as f:
+            f.write(f"# MottaHunter findings for {domain}\n")
+            f.write(f"# Generated by MottaSec Fox on {generated_at}\n\n")
+            f.writelines(f"{email}\n" for email in sorted_emails)
+
+    @staticmethod
+    def _motta_write_csv(csv_path: Path, domain: str, sorted_emails: List[str], date_str: str) -> None:
+        """Write the CSV findings through an 8MB binary buffer."""
+        with open(csv_path, 'wb', buffering=1 << 23) as raw, \
+                io.TextIOWrapper(raw, encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Email', 'Domain', 'Discovery_Date'])  # Header
+            writer.writerows((email, domain, date_str) for email in sorted_emails)
+
 
 def add_motta_common_args(parser):
     """Add arguments that are common to multiple commands."""
@@ -244,11 +330,14 @@ def add_motta_common_args(parser):
     parser.add_argument("--debug", type=int, choices=[0, 1, 2], default=0,
                        help="Debug level (0=minimal, 1=moderate, 2=verbose)")
     parser.add_argument("--delay", type=int, nargs=2, default=[20, 30],
-                       help="Random delay range in seconds (min, max)")
+                       help="Random delay range in seconds (min, max) between SMTP validation "
+                            "chunks of up to 100 addresses; shorter lists go out in one chunk")
     parser.add_argument("--no-check", action="store_true",
                        help="Skip checking default email (info@domain)")
     parser.add_argument("--check-email", type=str,
                        help="Custom email to check instead of info@domain")
+    parser.add_argument("--concurrency", type=int, default=1,
+                       help="Number of parallel SMTP validation workers")
 
 
 def main():
@@ -301,6 +390,10 @@ def main():
         print("Error: --sender-email is required when using --validate with hunting")
         sys.exit(1)
 
+    if args.concurrency < 1:
+        print("Error: --concurrency must be at least 1")
+        sys.exit(1)
+
     if args.command == "validate" and args.part and not 1 <= args.part <= args.total_parts:
         print(f"Error: --part must be between 1 and {args.total_parts}")
         sys.exit(1)
@@ -310,14 +403,12 @@ def main():
         print("Error: --check-email must be a valid email address (e.g., user@domain)")
         sys.exit(1)
 
+    # Scraper reports are written by a background thread from here on
+    log_listener = motta_start_logging()
+
     try:
         # MottaSec Fox banner
-        print("""
-        ╔═══════════════════════════════════════════════╗
-        ║  🦊 MottaHunter - Email Reconnaissance Tool   ║
-        ║      Developed with ❤️ by MottaSec Jedis      ║
-        ╚═══════════════════════════════════════════════╝
-        """)
+        print(MOTTA_BANNER)
         
         hunter = MottaHunter(args)
         
@@ -339,6 +430,8 @@ def main():
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        log_listener.stop()  # Flush whatever the scrapers still have queued
 
 
 if __name__ == "__main__":
@@ -12,19 +12,28 @@ Website: https://mottasec.com
 Contact: ghost@mottasec.com
 """
 
+import asyncio
+import atexit
 import os
+import queue
 import re
 import time
+from functools import lru_cache
+from http.cookies import Morsel, SimpleCookie
+import aiohttp
+from yarl import URL
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from dotenv import load_dotenv
+import tldextract
+from motta_logging import SUCCESS, motta_get_logger
 
 # ANSI color codes for terminal - MottaSec style!
 GREEN = "\033[92m"  # Success - MottaSec Fox approved
@@ -32,6 +41,54 @@ RED = "\033[91m"    # Failure - MottaSec Ghost says no
 BLUE = "\033[94m"   # Info - MottaSec Aces intel
 RESET = "\033[0m"   # Reset to default color
 
+log = motta_get_logger("linkedin")  # MottaSec field reports, queued once main() starts logging
+
+# MottaSec Aces wear the same disguise in Chrome and in the HTTP session
+LINKEDIN_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36'
+LINKEDIN_MAX_PARALLEL = 8  # Company pages fetched at once
+LINKEDIN_PAGE_TIMEOUT = 20  # Seconds per company page
+
+# Top 3 company links on a search results page, filtered inside the browser
+COMPANY_LINKS_XPATH = "(//a[contains(@class, 'app-aware-link') and contains(@href, '/company/')])[position() <= 3]"
+
+# Bundled public suffix list only - no network fetch before the hunt
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
+
+# MottaSec Aces keep logged-in browsers warm between hunts
+DRIVER_POOL_SIZE = 2
+DRIVER_MAX_IDLE = 100  # Seconds an idle driver may wait before it is retired
+
+_DRIVER_POOL = queue.Queue(maxsize=DRIVER_POOL_SIZE)  # (driver, released_at)
+
+@lru_cache(maxsize=256)
+def _motta_email_re(domain):
+    """Compile the bytes email pattern for a domain once, then reuse it."""
+    return re.compile((r"[a-zA-Z0-9._%+-]+@" + re.escape(domain)).encode())
+
+def motta_company_name(domain):
+    """
+    Extract the company name LinkedIn should be searched for.
+    
+    Uses the public suffix list, so mail.acme.co.uk gives "acme" rather than "co".
+    
+    Args:
+        domain: The target domain
+        
+    Returns:
+        str: The registrable label of the domain
+    """
+    return _TLD_EXTRACT(domain).domain or domain.split('.')[0]
+
+@lru_cache(maxsize=1)
+def _motta_ensure_env():
+    """Read .env once per process - later logins find the variables already set."""
+    load_dotenv()
+
+@lru_cache(maxsize=1)
+def _motta_driver_path():
+    """Resolve the ChromeDriver binary once per process instead of once per hunt."""
+    return ChromeDriverManager().install()
+
 def motta_setup_driver():
     """
     Setup Chrome WebDriver with appropriate options.
@@ -42,7 +99,7 @@ def motta_setup_driver():
     Returns:
         Configured Chrome WebDriver instance
     """
-    print(f"{BLUE}🛠️ MottaSec Aces are preparing the reconnaissance vehicle...{RESET}")
+    log.info("🛠️ MottaSec Aces are preparing the reconnaissance vehicle...")
     
     chrome_options = Options()
     chrome_options.add_argument('--headless')
@@ -51,16 +108,25 @@ def motta_setup_driver():
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
     
+    # MottaSec Aces only read the HTML - skip images, fonts, stylesheets and plugins
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+    })
+    
     # MottaSec Aces use a custom user agent to blend in
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36')
+    chrome_options.add_argument(f'--user-agent={LINKEDIN_USER_AGENT}')
     
     try:
-        service = Service(ChromeDriverManager().install())
+        service = Service(_motta_driver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        print(f"{GREEN}✅ MottaSec Aces' reconnaissance vehicle is ready!{RESET}")
+        log.log(SUCCESS, "✅ MottaSec Aces' reconnaissance vehicle is ready!")
         return driver
     except Exception as e:
-        print(f"{RED}🚨 MottaSec Aces encountered an error setting up the driver: {e}{RESET}")
+        log.error("🚨 MottaSec Aces encountered an error setting up the driver: %s", e)
         raise
 
 def motta_linkedin_login(driver, debug=0):
@@ -77,7 +143,7 @@ def motta_linkedin_login(driver, debug=0):
         ValueError: If LinkedIn credentials are missing
         Exception: If login fails
     """
-    load_dotenv()
+    _motta_ensure_env()
     email = os.getenv('LINKEDIN_EMAIL')
     password = os.getenv('LINKEDIN_PASSWORD')
     
@@ -86,7 +152,7 @@ def motta_linkedin_login(driver, debug=0):
     
     try:
         if debug >= 1:
-            print(f"{BLUE}🔑 MottaSec Aces are authenticating with LinkedIn...{RESET}")
+            log.info("🔑 MottaSec Aces are authenticating with LinkedIn...")
             
         driver.get('https://www.linkedin.com/login')
         
@@ -107,16 +173,159 @@ def motta_linkedin_login(driver, debug=0):
         )
         
         if debug >= 1:
-            print(f"{GREEN}✅ MottaSec Aces have successfully infiltrated LinkedIn{RESET}")
+            log.log(SUCCESS, "✅ MottaSec Aces have successfully infiltrated LinkedIn")
             
     except Exception as e:
         if debug >= 1:
-            print(f"{RED}🚨 MottaSec Aces failed to login to LinkedIn: {e}{RESET}")
+            log.error("🚨 MottaSec Aces failed to login to LinkedIn: %s", e)
         raise
 
-def motta_linkedin_hunt(domain, debug=0):
+def _motta_cookie_jar(driver_cookies):
     """
-    Hunt through LinkedIn for potential email addresses associated with the domain.
+    Copy the browser's cookies into an aiohttp jar, keeping each cookie's domain and path.
+    
+    Scoped cookies are only sent back to LinkedIn, even if a page redirects elsewhere.
+    
+    Args:
+        driver_cookies: Cookie dicts as returned by driver.get_cookies()
+        
+    Returns:
+        aiohttp.CookieJar holding the cookies
+    """
+    jar = aiohttp.CookieJar()
+    cookies = SimpleCookie()
+    for cookie in driver_cookies:
+        name = cookie['name']
+        morsel = Morsel()
+        morsel.set(name, cookie['value'], cookie['value'])  # Send the value exactly as the browser does
+        cookies[name] = morsel
+        cookies[name]['domain'] = cookie.get('domain', '')
+        cookies[name]['path'] = cookie.get('path', '/')
+    jar.update_cookies(cookies, URL("https://www.linkedin.com/"))
+    return jar
+
+async def _motta_fetch_linkedin_page(session, semaphore, url, debug=0):
+    """
+    Fetch one LinkedIn page over the shared HTTP session.
+    
+    Args:
+        session: aiohttp.ClientSession carrying the LinkedIn cookies
+        semaphore: asyncio.Semaphore bounding concurrent requests
+        url: Page to fetch
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+    
+    Returns:
+        bytes: Raw page body, or b"" if the fetch failed
+    """
+    async with semaphore:
+        if debug >= 1:
+            log.info("🔎 MottaSec Aces are investigating: %s", url)
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    if debug >= 2:
+                        log.warning("⚠️ MottaSec Aces got HTTP %s from %s", response.status, url)
+                    return b""
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if debug >= 1:
+                log.error("🚨 MottaSec Aces could not fetch %s: %s", url, e)
+            return b""
+
+async def motta_linkedin_fetch_pages(urls, cookies=None, debug=0):
+    """
+    Fetch LinkedIn pages concurrently, reusing the browser's login cookies.
+    
+    MottaSec Aces don't need a whole browser to read a page - one HTTP round
+    trip per page, all of them in flight at once.
+    
+    Args:
+        urls: Page URLs to fetch
+        cookies: Cookie dicts as returned by driver.get_cookies()
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+    
+    Returns:
+        list: Raw page body for each URL, in order (b"" for failed fetches)
+    """
+    semaphore = asyncio.Semaphore(LINKEDIN_MAX_PARALLEL)
+    timeout = aiohttp.ClientTimeout(total=LINKEDIN_PAGE_TIMEOUT)
+    cookie_jar = _motta_cookie_jar(cookies or [])
+    async with aiohttp.ClientSession(headers={"User-Agent": LINKEDIN_USER_AGENT},
+                                     cookie_jar=cookie_jar, timeout=timeout) as session:
+        return await asyncio.gather(
+            *(_motta_fetch_linkedin_page(session, semaphore, url, debug) for url in urls)
+        )
+
+def motta_driver_acquire(debug=0):
+    """
+    Take an idle logged-in driver from the pool, or start and log in a new one.
+    
+    Drivers idle for longer than DRIVER_MAX_IDLE are retired on the way, since
+    LinkedIn sessions and Chrome itself don't age well.
+    
+    Args:
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+        
+    Returns:
+        Chrome WebDriver instance, with motta_logged_in set to the login outcome
+    """
+    while True:
+        try:
+            driver, released_at = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        if time.monotonic() - released_at <= DRIVER_MAX_IDLE:
+            return driver
+        motta_driver_discard(driver)
+
+    driver = motta_setup_driver()
+    try:
+        motta_linkedin_login(driver, debug)
+        driver.motta_logged_in = True
+    except Exception as e:
+        log.error("🚨 Authentication failed, continuing with limited reconnaissance: %s", e)
+        # Continue without login, but with limited capabilities
+        driver.motta_logged_in = False
+    return driver
+
+def motta_driver_release(driver):
+    """
+    Park a driver for the next hunt, or quit it if it isn't worth keeping.
+    
+    Only logged-in drivers are pooled, so the next hunt gets a fresh login attempt.
+    
+    Args:
+        driver: Driver obtained from motta_driver_acquire
+    """
+    if getattr(driver, 'motta_logged_in', False):
+        try:
+            _DRIVER_POOL.put_nowait((driver, time.monotonic()))
+            return
+        except queue.Full:
+            pass
+    motta_driver_discard(driver)
+
+def motta_driver_discard(driver):
+    """Quit a driver, ignoring a browser that has already gone away."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def motta_driver_close_all():
+    """Quit every pooled driver - MottaSec Aces always cover their tracks."""
+    while True:
+        try:
+            driver, _ = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        motta_driver_discard(driver)
+
+atexit.register(motta_driver_close_all)
+
+def motta_linkedin_hunt_stream(domain, debug=0):
+    """
+    Hunt through LinkedIn, yielding each new email address as soon as it is found.
     
     MottaSec Aces excel at finding professional contact information through
     company pages, employee profiles, and about sections.
@@ -125,132 +334,131 @@ def motta_linkedin_hunt(domain, debug=0):
         domain: The domain to search for
         debug: Debug level (0=minimal, 1=moderate, 2=verbose)
     
-    Returns:
-        list: List of unique email addresses found
+    Yields:
+        str: Unique email addresses, in discovery order
     """
     emails = set()
     driver = None
     
     try:
-        # MottaSec Aces prepare for the hunt
-        driver = motta_setup_driver()
+        # MottaSec Aces prepare for the hunt - a logged-in driver from the pool when there is one
+        driver = motta_driver_acquire(debug)
         if debug >= 1:
-            print(f"{BLUE}🚀 MottaSec Aces' reconnaissance mission has begun{RESET}")
-        
-        # Login to LinkedIn - MottaSec Aces always authenticate
-        try:
-            motta_linkedin_login(driver, debug)
-        except Exception as e:
-            print(f"{RED}🚨 Authentication failed, continuing with limited reconnaissance: {e}{RESET}")
-            # Continue without login, but with limited capabilities
+            log.info("🚀 MottaSec Aces' reconnaissance mission has begun")
         
         # Extract company name from domain - MottaSec Aces' intelligence gathering
-        company_name = domain.split('.')[0]  # Simple extraction
-        
-        # Try to find better company name if possible
-        if '.' in domain and len(domain.split('.')) > 2:
-            parts = domain.split('.')
-            if len(parts) >= 3 and len(parts[-3]) > 3:  # Likely the company name
-                company_name = parts[-3]
+        company_name = motta_company_name(domain)
         
         if debug >= 1:
-            print(f"{BLUE}🔍 MottaSec Aces are searching for company: {company_name}{RESET}")
+            log.info("🔍 MottaSec Aces are searching for company: %s", company_name)
         
         # MottaSec Aces' hunt begins - search for the company
         search_url = f"https://www.linkedin.com/search/results/companies/?keywords={company_name}"
         driver.get(search_url)
-        time.sleep(3)  # Wait for results to load
         
         # Hunt through company search results
         company_urls = []
         try:
-            # Find company links - MottaSec Aces cast a wide net
-            company_links = WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.app-aware-link"))
+            # Wait for the results to render - MottaSec Aces cast a wide net
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a.app-aware-link"))
             )
             
-            # Extract company URLs - MottaSec Aces are thorough
-            for link in company_links[:3]:  # Check top 3 results
-                url = link.get_attribute('href')
-                if '/company/' in url:
-                    company_urls.append(url)
-                    if debug >= 2:
-                        print(f"{BLUE}🏢 MottaSec Aces found company page: {url}{RESET}")
+            # Let the browser pick the top 3 company links - MottaSec Aces are thorough
+            company_links = driver.find_elements(By.XPATH, COMPANY_LINKS_XPATH)
+            company_urls = [link.get_attribute('href') for link in company_links]
+            if debug >= 2:
+                for url in company_urls:
+                    log.info("🏢 MottaSec Aces found company page: %s", url)
             
             if not company_urls:
                 if debug >= 1:
-                    print(f"{RED}⚠️ MottaSec Aces couldn't find company pages for {company_name}{RESET}")
+                    log.warning("⚠️ MottaSec Aces couldn't find company pages for %s", company_name)
         except TimeoutException:
             if debug >= 1:
-                print(f"{RED}⚠️ MottaSec Aces: No company results found{RESET}")
+                log.warning("⚠️ MottaSec Aces: No company results found")
         
-        # Visit each company page - MottaSec Aces investigate thoroughly
+        # Visit each company page and its About section at once - MottaSec Aces investigate thoroughly
+        page_urls = []
         for company_url in company_urls:
-            if debug >= 1:
-                print(f"{BLUE}🔎 MottaSec Aces are investigating: {company_url}{RESET}")
-                
-            driver.get(company_url)
-            time.sleep(3)
-            
-            # Check "About" section - MottaSec Aces know where to look
-            try:
-                about_button = driver.find_element(By.XPATH, "//a[contains(@href, '/about/')]")
-                about_url = about_button.get_attribute('href')
-                driver.get(about_url)
-                time.sleep(2)
-            except NoSuchElementException:
-                if debug >= 2:
-                    print(f"{BLUE}ℹ️ MottaSec Aces: No About section found, checking main page{RESET}")
-            
-            # Extract text content - MottaSec Aces gather intelligence
-            page_content = driver.page_source
-            
-            # Find email addresses - MottaSec Aces' pattern recognition
-            email_regex = r"[a-zA-Z0-9._%+-]+@" + re.escape(domain)
-            found_emails = re.findall(email_regex, page_content)
+            page_urls.append(company_url)
+            page_urls.append(company_url.split('?')[0].rstrip('/') + '/about/')
+        pages = asyncio.run(motta_linkedin_fetch_pages(page_urls, driver.get_cookies(), debug))
+        
+        # Find email addresses straight in the raw bytes - MottaSec Aces' pattern recognition
+        email_pat = _motta_email_re(domain)
+        for page_content in pages:
+            found_emails = [match.group(0).decode() for match in email_pat.finditer(page_content)]
             
             if found_emails:
                 if debug >= 1:
-                    print(f"{GREEN}🎯 MottaSec Aces found emails: {found_emails}{RESET}")
-                emails.update(found_emails)
+                    log.log(SUCCESS, "🎯 MottaSec Aces found emails: %s", found_emails)
+                yield from _motta_new_emails(found_emails, emails)
         
         # If no emails found, try people search - MottaSec Aces' backup plan
         if not emails and debug >= 1:
-            print(f"{BLUE}🔄 MottaSec Aces are trying alternative approach: people search{RESET}")
+            log.info("🔄 MottaSec Aces are trying alternative approach: people search")
             
             people_url = f"https://www.linkedin.com/search/results/people/?keywords={company_name}"
             driver.get(people_url)
-            time.sleep(3)
+            try:
+                # Wait for the results to render rather than a fixed pause
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "main"))
+                )
+            except TimeoutException:
+                if debug >= 2:
+                    log.info("ℹ️ MottaSec Aces: People search is slow to render, reading what is there")
             
             # Extract text content from people search
-            page_content = driver.page_source
+            page_content = driver.page_source.encode("utf-8", "ignore")
             
             # Find email addresses
-            email_regex = r"[a-zA-Z0-9._%+-]+@" + re.escape(domain)
-            found_emails = re.findall(email_regex, page_content)
+            found_emails = [match.group(0).decode() for match in email_pat.finditer(page_content)]
             
             if found_emails:
                 if debug >= 1:
-                    print(f"{GREEN}🎯 MottaSec Aces found emails from people search: {found_emails}{RESET}")
-                emails.update(found_emails)
+                    log.log(SUCCESS, "🎯 MottaSec Aces found emails from people search: %s", found_emails)
+                yield from _motta_new_emails(found_emails, emails)
         
         # MottaSec Aces report findings
         if debug >= 1:
-            print(f"{BLUE}📊 MottaSec Aces' hunt summary: Found {len(emails)} unique email(s) on LinkedIn{RESET}")
-            
-        return list(emails)
+            log.info("📊 MottaSec Aces' hunt summary: Found %d unique email(s) on LinkedIn", len(emails))
         
     except Exception as e:
         if debug >= 1:
-            print(f"{RED}🚨 MottaSec Aces encountered an error during LinkedIn hunting: {e}{RESET}")
-        return []
+            log.error("🚨 MottaSec Aces encountered an error during LinkedIn hunting: %s", e)
+        # A driver that failed mid-hunt is not trusted with the next one
+        if driver:
+            motta_driver_discard(driver)
+            driver = None
         
     finally:
         # MottaSec Aces always clean up after operations
         if driver:
             if debug >= 1:
-                print(f"{BLUE}🧹 MottaSec Aces are covering their tracks...{RESET}")
-            driver.quit()
+                log.info("🧹 MottaSec Aces are covering their tracks...")
+            motta_driver_release(driver)
+
+def _motta_new_emails(found_emails, seen):
+    """Yield the emails not seen before, remembering them in seen."""
+    for email in found_emails:
+        if email not in seen:
+            seen.add(email)
+            yield email
+
+def motta_linkedin_hunt(domain, debug=0):
+    """
+    Hunt through LinkedIn for potential email addresses associated with the domain.
+    
+    Args:
+        domain: The domain to search for
+        debug: Debug level (0=minimal, 1=moderate, 2=verbose)
+    
+    Returns:
+        list: List of unique email addresses found
+    """
+    return list(motta_linkedin_hunt_stream(domain, debug))
 
 # Aliases for backward compatibility
 setup_driver = motta_setup_driver
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MottaHunter Logging Module
+Developed by MottaSec Ninjas for the MottaHunter toolkit
+
+This module routes the scrapers' colourful chatter through the logging module.
+As MottaSec Ninjas say: "Report everything, but never block the hunt."
+
+Author: MottaSec Ninjas
+Website: https://mottasec.com
+Contact: ghost@mottasec.com
+"""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# ANSI color codes for terminal - MottaSec style!
+GREEN = "\033[92m"  # Success - MottaSec Fox approved
+RED = "\033[91m"    # Failure - MottaSec Ghost says no
+BLUE = "\033[94m"   # Info - MottaSec Aces intel
+RESET = "\033[0m"   # Reset to default color
+
+# Between INFO and WARNING - for the MottaSec Fox's "found it!" moments
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+
+MOTTA_LOGGER = "mottahunter"
+
+
+class MottaColorFormatter(logging.Formatter):
+    """Paint each message in its level's MottaSec colour: blue intel, green wins, red trouble."""
+
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{RED}{message}{RESET}"
+        if record.levelno >= SUCCESS:
+            return f"{GREEN}{message}{RESET}"
+        return f"{BLUE}{message}{RESET}"
+
+
+def _motta_stdout_handler():
+    """Build the colour handler that finally writes to stdout."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(MottaColorFormatter("%(message)s"))
+    return handler
+
+
+def motta_get_logger(name):
+    """
+    Get a MottaHunter logger, e.g. motta_get_logger("google").
+
+    Args:
+        name: Short source name, appended to the "mottahunter" logger
+
+    Returns:
+        logging.Logger that writes through the MottaHunter handlers
+    """
+    return logging.getLogger(f"{MOTTA_LOGGER}.{name}")
+
+
+def motta_start_logging():
+    """
+    Move log output to a background thread - scrapers only enqueue records.
+
+    Call once from main(); until then (library use, tests) messages are
+    written directly to stdout.
+
+    Returns:
+        The started QueueListener; call stop() on it to flush before exit
+    """
+    records = queue.Queue(-1)
+    listener = QueueListener(records, _motta_stdout_handler())
+    _MOTTA_ROOT.handlers[:] = [QueueHandler(records)]
+    listener.start()
+    return listener
+
+
+# Direct stdout output until motta_start_logging() takes over
+_MOTTA_ROOT = logging.getLogger(MOTTA_LOGGER)
+_MOTTA_ROOT.setLevel(logging.DEBUG)
+_MOTTA_ROOT.propagate = False
+_MOTTA_ROOT.addHandler(_motta_stdout_handler())
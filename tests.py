@@ -11,9 +11,24 @@ Website: https://mottasec.com
 Contact: ghost@mottasec.com
 """
 
+import asyncio
+import io
+import logging
+import os
+import queue
+import smtplib
+import sys
+import tempfile
+import time
 import unittest
 from unittest.mock import patch, MagicMock
-from email_validation import motta_generate_permutations
+import email_validation
+from email_validation import (motta_generate_permutations, motta_generate_permutations_bulk,
+                              motta_count_permutations, motta_generate_permutations_range,
+                              motta_resolve_mx, motta_validate_emails_pipelined,
+                              motta_validate_info_address, motta_validate_email_smtp, MottaSMTP)
+import google_scraper
+import linkedin_scraper
 from harvester import MottaHunter
 
 # ANSI color codes for terminal - MottaSec style!
@@ -21,102 +36,415 @@ GREEN = "\033[92m"  # Success - MottaSec Fox approved
 RED = "\033[91m"    # Failure - MottaSec Ghost says no
 BLUE = "\033[94m"   # Info - MottaSec Aces intel
 RESET = "\033[0m"   # Reset to default color
+if not sys.stdout.isatty():
+    GREEN = RED = BLUE = RESET = ""  # No escapes in CI logs
+
+# Quiet by default - MOTTA_TEST_VERBOSE=1 lets the MottaSec Fox narrate
+log = logging.getLogger("motta.tests")
+if os.getenv("MOTTA_TEST_VERBOSE", "0") == "1":
+    log.setLevel(logging.DEBUG)
+    log.addHandler(logging.StreamHandler(sys.stdout))
+else:
+    log.setLevel(logging.WARNING)
 
 class TestMottaPermutations(unittest.TestCase):
     """Test the email permutation generator - MottaSec style!"""
     
     def test_basic_permutations(self):
         """Test basic (level 1) permutations"""
-        print(f"{BLUE}🦊 MottaSec Fox is testing basic permutations...{RESET}")
-        perms = motta_generate_permutations("John", "Doe", "example.com", 1)
-        expected = [
+        log.debug("%s🦊 MottaSec Fox is testing basic permutations...%s", BLUE, RESET)
+        perms = motta_generate_permutations("John", "Doe", "example.com", 1, as_set=True)
+        expected = {
             "johndoe@example.com",
             "john.doe@example.com",
             "jdoe@example.com",
             "j.doe@example.com",
             "j_doe@example.com",
             "john-doe@example.com",
-        ]
-        self.assertEqual(set(perms), set(expected))
-        print(f"{GREEN}✅ MottaSec Fox approves: Basic permutations test passed!{RESET}")
+        }
+        self.assertEqual(perms, expected)
+        log.debug("%s✅ MottaSec Fox approves: Basic permutations test passed!%s", GREEN, RESET)
         
     def test_medium_permutations(self):
         """Test medium (level 2) permutations"""
-        print(f"{BLUE}🦊 MottaSec Fox is testing medium permutations...{RESET}")
-        perms = motta_generate_permutations("John", "Doe", "example.com", 2)
+        log.debug("%s🦊 MottaSec Fox is testing medium permutations...%s", BLUE, RESET)
+        perms = motta_generate_permutations("John", "Doe", "example.com", 2, as_set=True)
         # Level 2 should include all level 1 permutations plus more
         self.assertIn("john@example.com", perms)
         self.assertIn("doe@example.com", perms)
         self.assertTrue(len(perms) > 6)  # More than basic permutations
-        print(f"{GREEN}✅ MottaSec Fox approves: Medium permutations test passed!{RESET}")
+        log.debug("%s✅ MottaSec Fox approves: Medium permutations test passed!%s", GREEN, RESET)
         
     def test_heavy_permutations(self):
         """Test heavy (level 3) permutations - for the MottaSec Ninjas!"""
-        print(f"{BLUE}🦊 MottaSec Fox is testing advanced permutations...{RESET}")
-        perms = motta_generate_permutations("John", "Doe", "example.com", 3)
+        log.debug("%s🦊 MottaSec Fox is testing advanced permutations...%s", BLUE, RESET)
+        perms = motta_generate_permutations("John", "Doe", "example.com", 3, as_set=True)
         # Level 3 should include all level 2 permutations plus more
         self.assertIn("jdoe@example.com", perms)
         self.assertTrue(len(perms) > 12)  # More than medium permutations
-        print(f"{GREEN}✅ MottaSec Fox approves: Advanced permutations test passed!{RESET}")
+        log.debug("%s✅ MottaSec Fox approves: Advanced permutations test passed!%s", GREEN, RESET)
         
     def test_lowercase_conversion(self):
         """Test that all emails are converted to lowercase - MottaSec standard!"""
-        print(f"{BLUE}🦊 MottaSec Fox is testing case normalization...{RESET}")
-        perms = motta_generate_permutations("John", "DOE", "Example.COM", 1)
+        log.debug("%s🦊 MottaSec Fox is testing case normalization...%s", BLUE, RESET)
+        perms = motta_generate_permutations("John", "DOE", "Example.COM", 1, as_set=True)
         for email in perms:
             self.assertEqual(email, email.lower())
-        print(f"{GREEN}✅ MottaSec Fox approves: Case normalization test passed!{RESET}")
+        log.debug("%s✅ MottaSec Fox approves: Case normalization test passed!%s", GREEN, RESET)
+
+    def test_bulk_permutations(self):
+        """Test roster permutations - MottaSec Aces hunt whole teams!"""
+        log.debug("%s🦊 MottaSec Fox is testing bulk permutations...%s", BLUE, RESET)
+        names = [("John", "Doe"), ("Jane", "Doe"), ("John", "Doe")]
+        perms = motta_generate_permutations_bulk(names, "Example.com", 2)
+        expected = list(dict.fromkeys(
+            motta_generate_permutations("John", "Doe", "example.com", 2) +
+            motta_generate_permutations("Jane", "Doe", "example.com", 2)
+        ))
+        self.assertEqual(perms, expected)
+        self.assertEqual(perms.count("doe@example.com"), 1)  # Shared by both, kept once
+        log.debug("%s✅ MottaSec Fox approves: Bulk permutations test passed!%s", GREEN, RESET)
+
+    def test_permutations_range(self):
+        """Test that a range matches the same slice of the full list"""
+        log.debug("%s🦊 MottaSec Fox is testing permutation ranges...%s", BLUE, RESET)
+        perms = motta_generate_permutations("Ann", "Ann", "Example.com", 3)  # Plenty of duplicates
+        self.assertEqual(motta_count_permutations("Ann", "Ann", 3), len(perms))
+        for start, end in [(0, 3), (3, 7), (7, len(perms))]:
+            self.assertEqual(motta_generate_permutations_range("Ann", "Ann", "Example.com", 3, start, end),
+                             perms[start:end])
+        log.debug("%s✅ MottaSec Fox approves: Permutation range test passed!%s", GREEN, RESET)
+
+
+class TestMottaSMTP(unittest.TestCase):
+    """Test the pipelining SMTP client - MottaSec Ninja speed!"""
+
+    def _motta_fake_smtp(self, extensions, wire=b""):
+        """Build a MottaSMTP that never touches the network"""
+        smtp = MottaSMTP()
+        smtp.esmtp_features = extensions
+        smtp.sock = MagicMock()
+        smtp.file = io.BytesIO(wire)
+        smtp.rcpt = MagicMock(side_effect=[(250, b"OK"), (550, b"No such user")])
+        return smtp
+
+    def test_pipeline_rcpts(self):
+        """Test that all RCPTs go out in one write before any reply is read"""
+        log.debug("%s🦊 MottaSec Fox is testing RCPT pipelining...%s", BLUE, RESET)
+        smtp = self._motta_fake_smtp({"pipelining": ""}, b"250 OK\r\n550-No such\r\n550 user\r\n")
+        replies = smtp.pipeline_rcpts(["a@example.com", "b@example.com"])
+        self.assertEqual(replies, [(250, b"OK"), (550, b"No such\nuser")])
+        smtp.sock.sendall.assert_called_once_with(b"RCPT TO:<a@example.com>\r\nRCPT TO:<b@example.com>\r\n")
+        smtp.rcpt.assert_not_called()
+        log.debug("%s✅ MottaSec Fox approves: RCPT pipelining test passed!%s", GREEN, RESET)
+
+    def test_greet_reuses_features_for_same_reply_only(self):
+        """Test that cached EHLO extensions are only reused when the reply matches"""
+        log.debug("%s🦊 MottaSec Fox is testing the EHLO cache...%s", BLUE, RESET)
+        known = (b"mx.example.com\nPIPELINING\nSIZE 100", {"pipelining": "", "size": "100"})
+        for reply, pipelining in [(known[0], True), (b"mx.example.com\nSIZE 100", False)]:
+            with self.subTest(reply=reply):
+                smtp = MottaSMTP()
+                smtp.docmd = MagicMock(return_value=(250, reply))
+                smtp.motta_greet(known)
+                self.assertEqual(smtp.has_extn("pipelining"), pipelining)
+                self.assertEqual(smtp.esmtp_features["size"], "100")
+                smtp.docmd.assert_called_once_with("ehlo", "mottasec.com")
+        log.debug("%s✅ MottaSec Fox approves: EHLO cache test passed!%s", GREEN, RESET)
+
+    def test_pipeline_rcpts_skips_unencodable(self):
+        """Test that an address the session can't encode is answered locally, not sent"""
+        log.debug("%s🦊 MottaSec Fox is testing unencodable addresses...%s", BLUE, RESET)
+        smtp = self._motta_fake_smtp({"pipelining": ""}, b"250 OK\r\n")
+        replies = smtp.pipeline_rcpts(["jos\u00e9.doe@example.com", "jdoe@example.com"])
+        self.assertEqual(replies, [email_validation.UNENCODABLE_REPLY, (250, b"OK")])
+        smtp.sock.sendall.assert_called_once_with(b"RCPT TO:<jdoe@example.com>\r\n")
+        log.debug("%s✅ MottaSec Fox approves: Unencodable address test passed!%s", GREEN, RESET)
+
+    def test_greet_refused_ehlo_goes_to_helo(self):
+        """Test that a refused EHLO on the cached path falls back to HELO without a second EHLO"""
+        log.debug("%s🦊 MottaSec Fox is testing the HELO fallback...%s", BLUE, RESET)
+        smtp = MottaSMTP()
+        smtp.docmd = MagicMock(return_value=(502, b"Command not implemented"))
+        smtp.ehlo = MagicMock()
+        smtp.helo = MagicMock(return_value=(250, b"mx.example.com"))
+        smtp.motta_greet((b"mx.example.com\nPIPELINING", {"pipelining": ""}))
+        smtp.ehlo.assert_not_called()
+        smtp.helo.assert_called_once_with("mottasec.com")
+        self.assertFalse(smtp.has_extn("pipelining"))
+        log.debug("%s✅ MottaSec Fox approves: HELO fallback test passed!%s", GREEN, RESET)
+
+    def test_pipeline_rcpts_fallback(self):
+        """Test the sequential fallback for servers without PIPELINING"""
+        log.debug("%s🦊 MottaSec Fox is testing the non-pipelining fallback...%s", BLUE, RESET)
+        smtp = self._motta_fake_smtp({})
+        replies = smtp.pipeline_rcpts(["a@example.com", "b@example.com"])
+        self.assertEqual([code for code, _ in replies], [250, 550])
+        smtp.sock.sendall.assert_not_called()
+        log.debug("%s✅ MottaSec Fox approves: Fallback test passed!%s", GREEN, RESET)
+
+
+class TestMottaPipelinedValidation(unittest.TestCase):
+    """Test validation flow: catch-all checks, throttling and MX rotation - MottaSec Ninjas move on when a den is busy!"""
+
+    def setUp(self):
+        email_validation._MX_HEALTH.clear()
+        self.rcpts = []  # (mx_server, email) for every RCPT sent
+
+    def _motta_fake_session(self, mx_server, replies):
+        """Build a pooled session whose RCPT replies come from replies(email); RSET hangs up"""
+        smtp = MagicMock(motta_mx_server=mx_server)
+
+        def pipeline_rcpts(emails):
+            self.rcpts.extend((mx_server, email) for email in emails)
+            return [replies(email) for email in emails]
+        smtp.pipeline_rcpts.side_effect = pipeline_rcpts
+        smtp.rset.side_effect = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return smtp
+
+    @patch('email_validation.motta_smtp_discard')
+    @patch('email_validation.motta_smtp_release')
+    @patch('email_validation.motta_smtp_acquire')
+    def test_throttled_addresses_move_on_once(self, mock_acquire, mock_release, mock_discard):
+        """Test that a 421 followed by a hang-up sends each address to the next MX exactly once"""
+        log.debug("%s🦊 MottaSec Fox is testing throttling deferral...%s", BLUE, RESET)
+        busy = lambda email: (421, b"Slow down") if email == "t1@x.com" else (250, b"OK")
+        mock_acquire.side_effect = lambda mx_server, debug, fresh=False: self._motta_fake_session(
+            mx_server, busy if mx_server == "mx1" else (lambda email: (250, b"OK")))
+
+        results = motta_validate_emails_pipelined(["t1@x.com", "t2@x.com", "t3@x.com"],
+                                                  "me@test.com", ["mx1", "mx2"], 0)
+        self.assertEqual(results, {"t1@x.com": True, "t2@x.com": True, "t3@x.com": True})
+        self.assertEqual(self.rcpts, [("mx1", "t1@x.com"), ("mx1", "t2@x.com"), ("mx1", "t3@x.com"),
+                                      ("mx2", "t1@x.com")])
+        mock_release.assert_not_called()
+        log.debug("%s✅ MottaSec Fox approves: Throttling deferral test passed!%s", GREEN, RESET)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('email_validation._motta_probe')
+    def test_info_address_and_catch_all(self, mock_probe, mock_stdout):
+        """Test the info@ verdict and catch-all detection from the paired probes"""
+        log.debug("%s🦊 MottaSec Fox is testing catch-all detection...%s", BLUE, RESET)
+        will_try = (252, b"Cannot verify, will try")
+        cases = [
+            ((250, b"OK"), (250, b"OK"), (True, True)),
+            ((250, b"OK"), (550, b"No such user"), (True, False)),
+            (will_try, will_try, (False, True)),
+            ((550, b"No such user"), (550, b"No such user"), (False, False)),
+        ]
+        for info_reply, random_reply, expected in cases:
+            with self.subTest(info=info_reply, random=random_reply):
+                mock_probe.return_value = [info_reply, random_reply]
+                self.assertEqual(motta_validate_info_address("x.com", "me@test.com", "mx1", 0,
+                                                             check_email="boss@x.com"), expected)
+                probed = mock_probe.call_args[0][0]
+                self.assertEqual(probed[0], "boss@x.com")
+                self.assertTrue(probed[1].startswith("mottasec-") and probed[1].endswith("@x.com"))
+        log.debug("%s✅ MottaSec Fox approves: Catch-all detection test passed!%s", GREEN, RESET)
+
+    @patch('email_validation.motta_smtp_discard')
+    @patch('email_validation.motta_smtp_release')
+    @patch('email_validation.motta_smtp_acquire')
+    def test_vrfy_verdicts_and_fallback(self, mock_acquire, mock_release, mock_discard):
+        """Test VRFY 250/550 answers directly and 252 falls back to RCPT TO"""
+        log.debug("%s🦊 MottaSec Fox is testing VRFY...%s", BLUE, RESET)
+        for vrfy_code, expected, rcpt_sent in [(250, True, False), (550, False, False), (252, False, True)]:
+            with self.subTest(vrfy=vrfy_code):
+                smtp = MagicMock()
+                smtp.has_extn.side_effect = lambda name: name == "vrfy"
+                smtp.verify.return_value = (vrfy_code, b"VRFY says so")
+                smtp.pipeline_rcpts.return_value = [(550, b"No such user")]
+                mock_acquire.return_value = smtp
+                self.assertIs(motta_validate_email_smtp("a@x.com", "me@test.com", "mx1", 0, try_vrfy=True),
+                              expected)
+                smtp.verify.assert_called_once_with("a@x.com")
+                self.assertEqual(smtp.pipeline_rcpts.called, rcpt_sent)
+        mock_discard.assert_not_called()
+        log.debug("%s✅ MottaSec Fox approves: VRFY test passed!%s", GREEN, RESET)
+
+    @patch('email_validation.motta_smtp_discard')
+    @patch('email_validation.motta_smtp_release')
+    @patch('email_validation.motta_smtp_acquire')
+    def test_non_ascii_name(self, mock_acquire, mock_release, mock_discard):
+        """Test that José's unencodable permutations don't sink the ASCII ones"""
+        log.debug("%s🦊 MottaSec Fox is testing non-ASCII names...%s", BLUE, RESET)
+        perms = motta_generate_permutations("Jos\u00e9", "Doe", "example.com", 1)
+        smtp = MottaSMTP()
+        smtp.sock = MagicMock()  # Server without PIPELINING: MAIL, three ASCII RCPTs, RSET
+        smtp.file = io.BytesIO(b"250 OK\r\n250 OK\r\n550 No such user\r\n550 No such user\r\n250 OK\r\n")
+        mock_acquire.return_value = smtp
+
+        results = motta_validate_emails_pipelined(perms, "me@test.com", ["mx1"], 0)
+        self.assertEqual([email for email in perms if results[email]], ["jdoe@example.com"])
+        self.assertEqual(smtp.sock.sendall.call_count, 5)  # The three josé addresses never went out
+        mock_release.assert_called_once_with(smtp, len(perms))
+        mock_discard.assert_not_called()
+        log.debug("%s✅ MottaSec Fox approves: Non-ASCII name test passed!%s", GREEN, RESET)
+
+    @patch('email_validation.MottaSMTP')
+    def test_stale_pool_retries_on_fresh_connection(self, mock_smtp_class):
+        """Test that two dead pooled sessions cost one retry on a brand-new connection"""
+        log.debug("%s🦊 MottaSec Fox is testing stale pooled sessions...%s", BLUE, RESET)
+        self.addCleanup(email_validation.motta_smtp_close_all)
+        probes = [
+            ("probe", lambda: email_validation._motta_probe(["a@x.com"], "me@test.com", "mx1", 0),
+             [(250, b"OK")]),
+            ("pipelined", lambda: motta_validate_emails_pipelined(["a@x.com"], "me@test.com", ["mx1"], 0),
+             {"a@x.com": True}),
+        ]
+        for name, probe, expected in probes:
+            with self.subTest(probe=name):
+                email_validation.motta_smtp_close_all()
+                pool = email_validation._SMTP_POOL["mx1"] = queue.Queue()
+                dead = [MagicMock(motta_mx_server="mx1", motta_rcpt_count=0) for _ in range(2)]
+                for smtp in dead:
+                    smtp.mail.side_effect = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+                    pool.put(smtp)
+                fresh = MagicMock(motta_mx_server="mx1", motta_rcpt_count=0, does_esmtp=False)
+                fresh.pipeline_rcpts.return_value = [(250, b"OK")]
+                mock_smtp_class.return_value = fresh
+
+                self.assertEqual(probe(), expected)
+                mock_smtp_class.assert_called_once_with("mx1", 25, timeout=10)
+                for smtp in dead:
+                    smtp.quit.assert_called_once_with()  # Both stale sessions were thrown away
+                mock_smtp_class.reset_mock()
+        log.debug("%s✅ MottaSec Fox approves: Stale session test passed!%s", GREEN, RESET)
 
+    def test_mx_rotation_benches_throttling_server(self):
+        """Test that chunks rotate over the top MX servers and a benched one goes last"""
+        log.debug("%s🦊 MottaSec Fox is testing MX rotation...%s", BLUE, RESET)
+        servers = ["mx1", "mx2", "mx3", "mx4"]
+        self.assertEqual(email_validation._motta_mx_rotation(servers, 1), ["mx2", "mx3", "mx1", "mx4"])
+        for _ in range(email_validation.MX_EJECT_AFTER):
+            email_validation._motta_mx_record("mx2", 421)
+        self.assertEqual(email_validation._motta_mx_rotation(servers, 1), ["mx3", "mx1", "mx4", "mx2"])
+        log.debug("%s✅ MottaSec Fox approves: MX rotation test passed!%s", GREEN, RESET)
 
+
+class TestMottaGoogle(unittest.TestCase):
+    """Test the Google hunt - MottaSec Fox keeps sniffing when one page goes cold!"""
+
+    @patch('google_scraper.time.sleep')
+    @patch('google_scraper._motta_user_agents', return_value=("MottaAgent/1.0",))
+    @patch('google_scraper._SESSION')
+    def test_failed_page_is_skipped(self, mock_session, mock_agents, mock_sleep):
+        """Test that a timeout on one page doesn't drop the pages after it"""
+        log.debug("%s🦊 MottaSec Fox is testing page failures...%s", BLUE, RESET)
+
+        def get(url, **kwargs):
+            if url.endswith("&start=0"):
+                raise google_scraper.requests.Timeout("Read timed out")
+            return MagicMock(status_code=200, text=f"<p>page{url[-2:]}@example.com</p>")
+        mock_session.get.side_effect = get
+
+        with self.assertLogs("mottahunter.google", level="ERROR") as logs:
+            found = google_scraper.motta_google_hunt("example.com", pages=3)
+        self.assertEqual(found, ["page10@example.com", "page20@example.com"])
+        self.assertIn("lost page 1", logs.output[0])
+        log.debug("%s✅ MottaSec Fox approves: Page failure test passed!%s", GREEN, RESET)
+
+
+class TestMottaLinkedIn(unittest.TestCase):
+    """Test the LinkedIn helpers - MottaSec Aces know who they're looking for!"""
+
+    def test_company_name(self):
+        """Test that the public suffix list picks the registrable label"""
+        log.debug("%s🦊 MottaSec Fox is testing company names...%s", BLUE, RESET)
+        for domain, expected in [("mail.acme.co.uk", "acme"), ("example.com", "example"),
+                                 ("www.mottasec.com", "mottasec")]:
+            with self.subTest(domain=domain):
+                self.assertEqual(linkedin_scraper.motta_company_name(domain), expected)
+        log.debug("%s✅ MottaSec Fox approves: Company name test passed!%s", GREEN, RESET)
+
+    def test_cookie_jar_scoped_to_linkedin(self):
+        """Test that the browser's cookies go back to linkedin.com hosts only, values untouched"""
+        log.debug("%s🦊 MottaSec Fox is testing cookie scoping...%s", BLUE, RESET)
+        driver_cookies = [
+            {'name': 'li_at', 'value': 'AQEDAR', 'domain': '.linkedin.com', 'path': '/'},
+            {'name': 'JSESSIONID', 'value': '"ajax:123"', 'domain': '.www.linkedin.com', 'path': '/'},
+        ]
+
+        async def sent_to(urls):  # aiohttp wants a running loop for its jar
+            jar = linkedin_scraper._motta_cookie_jar(driver_cookies)
+            return [{name: morsel.value for name, morsel in jar.filter_cookies(linkedin_scraper.URL(url)).items()}
+                    for url in urls]
+
+        www, bare, other, lookalike = asyncio.run(sent_to([
+            "https://www.linkedin.com/company/acme", "https://linkedin.com/",
+            "https://evil.example.com/", "https://notlinkedin.com/"]))
+        self.assertEqual(www, {'li_at': 'AQEDAR', 'JSESSIONID': '"ajax:123"'})
+        self.assertEqual(bare, {'li_at': 'AQEDAR'})
+        self.assertEqual(other, {})
+        self.assertEqual(lookalike, {})
+        log.debug("%s✅ MottaSec Fox approves: Cookie scoping test passed!%s", GREEN, RESET)
+
+
+class TestMottaMXCache(unittest.TestCase):
+    """Test the MX lookups - MottaSec Aces remember everything, but only as long as DNS allows!"""
+
+    @patch('email_validation._motta_resolver')
+    def test_resolve_mx_sorted(self, mock_resolver):
+        """Test that MX answers are sorted and looked up through the shared TTL-aware cache"""
+        log.debug("%s🦊 MottaSec Fox is testing the MX cache...%s", BLUE, RESET)
+        backup, primary = MagicMock(preference=20), MagicMock(preference=10)
+        backup.exchange.to_text.return_value = "mx2.example.com."
+        primary.exchange.to_text.return_value = "mx1.example.com."
+        mock_resolve = mock_resolver.return_value.resolve
+        mock_resolve.return_value = [backup, primary]
+
+        self.assertEqual(motta_resolve_mx("Example.COM"), (("mx1.example.com.", 10), ("mx2.example.com.", 20)))
+        mock_resolve.assert_called_once_with("example.com", 'MX')
+        # Caching is dnspython's job, so record TTLs are honoured
+        self.assertIs(email_validation._motta_configure_resolver(MagicMock()).cache, email_validation._DNS_CACHE)
+        log.debug("%s✅ MottaSec Fox approves: MX cache test passed!%s", GREEN, RESET)
+
+
+@patch('harvester._motta_ensure_env')
 class TestMottaHunter(unittest.TestCase):
     """Test the main MottaHunter class - MottaSec command center!"""
     
-    def test_motta_split(self):
+    def test_motta_part_bounds(self, mock_env):
         """Test splitting permutations into parts - MottaSec Fox's divide and conquer strategy"""
-        print(f"{BLUE}🦊 MottaSec Fox is testing permutation splitting...{RESET}")
-        # Create mock args
-        args = MagicMock()
-        hunter = MottaHunter(args)
-        
-        # Test with 10 items, 4 parts
-        perms = ["email1@test.com", "email2@test.com", "email3@test.com", 
-                "email4@test.com", "email5@test.com", "email6@test.com",
-                "email7@test.com", "email8@test.com", "email9@test.com", 
-                "email10@test.com"]
-        
-        # Part 1 should have 3 items (items 0, 1, 2)
-        part1 = hunter._motta_split(perms, 4, 1)
-        self.assertEqual(len(part1), 3)
-        self.assertEqual(part1[0], "email1@test.com")
-        
-        # Part 2 should have 3 items (items 3, 4, 5)
-        part2 = hunter._motta_split(perms, 4, 2)
-        self.assertEqual(len(part2), 3)
-        self.assertEqual(part2[0], "email4@test.com")
-        
-        # Part 3 should have 2 items (items 6, 7)
-        part3 = hunter._motta_split(perms, 4, 3)
-        self.assertEqual(len(part3), 2)
-        self.assertEqual(part3[0], "email7@test.com")
+        log.debug("%s🦊 MottaSec Fox is testing permutation splitting...%s", BLUE, RESET)
+        # 10 items over 4 parts: the first two parts take the extra item
+        cases = [(1, (0, 3)), (2, (3, 6)), (3, (6, 8)), (4, (8, 10))]
+        for part, bounds in cases:
+            with self.subTest(part=part):
+                self.assertEqual(MottaHunter._motta_part_bounds(10, 4, part), bounds)
+        log.debug("%s✅ MottaSec Fox approves: Permutation splitting test passed!%s", GREEN, RESET)
         
-        # Part 4 should have 2 items (items 8, 9)
-        part4 = hunter._motta_split(perms, 4, 4)
-        self.assertEqual(len(part4), 2)
-        self.assertEqual(part4[0], "email9@test.com")
-        print(f"{GREEN}✅ MottaSec Fox approves: Permutation splitting test passed!{RESET}")
-        
-    def test_motta_split_invalid_part(self):
+    def test_motta_part_bounds_invalid_part(self, mock_env):
         """Test error handling for invalid part number - MottaSec quality control"""
-        print(f"{BLUE}🦊 MottaSec Fox is testing error handling...{RESET}")
-        # Create mock args
-        args = MagicMock()
-        hunter = MottaHunter(args)
-        
-        perms = ["email1@test.com", "email2@test.com"]
-        
+        log.debug("%s🦊 MottaSec Fox is testing error handling...%s", BLUE, RESET)
         with self.assertRaises(ValueError):
-            hunter._motta_split(perms, 3, 4)  # Part 4 of 3 is invalid
-        print(f"{GREEN}✅ MottaSec Fox approves: Error handling test passed!{RESET}")
+            MottaHunter._motta_part_bounds(2, 3, 4)  # Part 4 of 3 is invalid
+        log.debug("%s✅ MottaSec Fox approves: Error handling test passed!%s", GREEN, RESET)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('harvester.time.localtime', return_value=time.struct_time((2024, 5, 6, 7, 8, 9, 0, 127, 0)))
+    def test_preserve_findings(self, mock_localtime, mock_stdout, mock_env):
+        """Test that the TXT and CSV findings keep their original format, byte for byte"""
+        log.debug("%s🦊 MottaSec Fox is testing the findings files...%s", BLUE, RESET)
+        workdir = tempfile.TemporaryDirectory()
+        self.addCleanup(workdir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(workdir.name)
+
+        hunter = MottaHunter(MagicMock(domain="example.com"))
+        hunter.emails.update({"b@example.com", "a@example.com"})
+        hunter._preserve_findings()
+
+        findings = os.path.join("motta_findings", "example.com_20240506_070809")
+        with open(findings + ".txt", "rb") as f:
+            self.assertEqual(f.read(), b"# MottaHunter findings for example.com\n"
+                                       b"# Generated by MottaSec Fox on 2024-05-06 07:08:09\n\n"
+                                       b"a@example.com\nb@example.com\n")
+        with open(findings + ".csv", "rb") as f:
+            self.assertEqual(f.read(), b"Email,Domain,Discovery_Date\r\n"
+                                       b"a@example.com,example.com,2024-05-06\r\n"
+                                       b"b@example.com,example.com,2024-05-06\r\n")
+        log.debug("%s✅ MottaSec Fox approves: Findings files test passed!%s", GREEN, RESET)
 
 
 if __name__ == '__main__':
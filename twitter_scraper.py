@@ -14,9 +14,11 @@ Contact: ghost@mottasec.com
 
 import os
 import re
-import time
 import tweepy
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from dotenv import load_dotenv
+from motta_logging import SUCCESS, motta_get_logger
 
 # ANSI color codes for terminal - MottaSec style!
 GREEN = "\033[92m"  # Success - MottaSec Fox approved
@@ -24,11 +26,52 @@ RED = "\033[91m"    # Failure - MottaSec Ghost says no
 BLUE = "\033[94m"   # Info - MottaSec Aces intel
 RESET = "\033[0m"   # Reset to default color
 
+log = motta_get_logger("twitter")  # MottaSec field reports, queued once main() starts logging
+
+TWITTER_MAX_PARALLEL = 5  # One worker per search query
+
+def _motta_email_scanner(domain):
+    """
+    Build a text -> emails function for the domain.
+    
+    MottaSec Ghost prefers a Hyperscan DFA when the optional hyperscan package
+    is installed; otherwise the compiled re pattern (ASCII-only classes skip
+    the Unicode tables) does the job.
+    
+    Args:
+        domain (str): The domain the emails must end with
+    
+    Returns:
+        callable: Takes a text and returns the list of matching emails
+    """
+    pattern = r"[a-zA-Z0-9._%+-]+@" + re.escape(domain)
+    try:
+        import hyperscan
+    except ImportError:
+        return re.compile(pattern, re.ASCII).findall
+
+    database = hyperscan.Database()
+    database.compile(expressions=[pattern.encode()], ids=[0], flags=[hyperscan.HS_FLAG_SOM_LEFTMOST])
+
+    def scan(text):
+        data = text.encode('utf-8')
+        spans = []
+        database.scan(data, match_event_handler=lambda _id, start, end, _flags, _ctx: spans.append((start, end)))
+        return [data[start:end].decode() for start, end in spans]
+    return scan
+
+@lru_cache(maxsize=1)
+def _motta_ensure_env():
+    """Read .env once per process."""
+    load_dotenv()
+
+@lru_cache(maxsize=1)
 def motta_setup_twitter_api():
     """
     Setup Twitter API using credentials from environment variables.
     
     MottaSec Aces always keep their API keys secure in environment variables!
+    The handle is built once per process and shared by every later hunt.
     
     Returns:
         Authenticated Tweepy API instance
@@ -36,7 +79,7 @@ def motta_setup_twitter_api():
     Raises:
         ValueError: If Twitter API credentials are missing
     """
-    load_dotenv()
+    _motta_ensure_env()
     api_key = os.getenv('TWITTER_API_KEY')
     api_secret = os.getenv('TWITTER_API_SECRET')
     access_token = os.getenv('TWITTER_ACCESS_TOKEN')
@@ -49,9 +92,34 @@ def motta_setup_twitter_api():
     auth.set_access_token(access_token, access_token_secret)
     return tweepy.API(auth, wait_on_rate_limit=True)
 
-def motta_twitter_hunt(domain, debug=0):
+def _motta_fetch_tweets(api, query, debug=0):
     """
-    Hunt through Twitter for potential email addresses associated with the domain.
+    Fetch up to 50 tweets for one search query.
+    
+    The API handle already waits out rate limits, so no extra sleeps are needed.
+    
+    Args:
+        api: Authenticated Tweepy API instance
+        query (str): Search query
+        debug (int): Debug level (0=minimal, 1=moderate, 2=verbose)
+    
+    Returns:
+        list: (tweet id, full text) pairs of the tweets found
+    """
+    if debug >= 1:
+        log.info("🔍 MottaSec Ghost is searching Twitter for: %s", query)
+        
+    # One page of 50 is all MottaSec Ghost needs - a single request, no cursor bookkeeping
+    tweets = []
+    for tweet in api.search_tweets(q=query, lang="en", tweet_mode="extended", count=50):
+        tweets.append((tweet.id_str, tweet.full_text))
+        if debug >= 2:
+            log.debug("📝 Processing tweet %d: %.50s...", len(tweets), tweet.full_text)
+    return tweets
+
+def motta_twitter_hunt_stream(domain, debug=0):
+    """
+    Hunt through Twitter, yielding each new email address as soon as a tweet reveals it.
     
     MottaSec Ghost's specialty is finding information people didn't know they shared.
     This function uses Twitter's API to search for mentions of the domain and
@@ -61,16 +129,17 @@ def motta_twitter_hunt(domain, debug=0):
         domain (str): The domain to search for
         debug (int): Debug level (0=minimal, 1=moderate, 2=verbose)
     
-    Returns:
-        list: List of unique email addresses found
+    Yields:
+        str: Unique email addresses, query by query as each one is scanned
     """
     emails = set()
+    seen_ids = set()  # The queries overlap - each tweet is scanned once
     
     try:
         # MottaSec Ghost prepares for the hunt
         api = motta_setup_twitter_api()
         if debug >= 1:
-            print(f"{BLUE}👻 MottaSec Ghost has successfully infiltrated Twitter API{RESET}")
+            log.info("👻 MottaSec Ghost has successfully infiltrated Twitter API")
         
         # Craft search queries - MottaSec Ghost's secret sauce
         queries = [
@@ -81,45 +150,50 @@ def motta_twitter_hunt(domain, debug=0):
             f"{domain} contact"
         ]
         
-        # MottaSec Ghost hunts through each query
-        for query in queries:
-            if debug >= 1:
-                print(f"{BLUE}🔍 MottaSec Ghost is searching Twitter for: {query}{RESET}")
+        # Build the scanner once for every tweet of every query
+        find_emails = _motta_email_scanner(domain)
+        
+        # MottaSec Ghost runs every query at once and scans each as soon as it lands
+        with ThreadPoolExecutor(max_workers=TWITTER_MAX_PARALLEL) as executor:
+            futures = [executor.submit(_motta_fetch_tweets, api, query, debug) for query in queries]
+            for future in as_completed(futures):
+                texts = []
+                for tweet_id, text in future.result():
+                    if tweet_id not in seen_ids:
+                        seen_ids.add(tweet_id)
+                        texts.append(text)
                 
-            # Use cursor to handle pagination - MottaSec Ghost can search far and wide
-            tweet_count = 0
-            for tweet in tweepy.Cursor(api.search_tweets, q=query, lang="en", tweet_mode="extended").items(50):
-                tweet_count += 1
-                if debug >= 2:
-                    print(f"{BLUE}📝 Processing tweet {tweet_count}: {tweet.full_text[:50]}...{RESET}")
-                    
-                # Extract emails from tweet text - MottaSec Ghost's pattern recognition
-                email_regex = r"[a-zA-Z0-9._%+-]+@" + re.escape(domain)
-                found_emails = re.findall(email_regex, tweet.full_text)
+                # Extract emails from all of the query's tweets in one scan - MottaSec Ghost's pattern recognition
+                found_emails = find_emails("\n".join(texts))
                 
                 if found_emails and debug >= 1:
-                    print(f"{GREEN}🎯 MottaSec Ghost found emails in tweet: {found_emails}{RESET}")
+                    log.log(SUCCESS, "🎯 MottaSec Ghost found emails in tweets: %s", found_emails)
                     
-                emails.update(found_emails)
-                
-                # Rate limiting - MottaSec Ghost moves cautiously
-                time.sleep(2)  # Be nice to Twitter's API
-            
-            # MottaSec Ghost needs to rest between queries
-            if debug >= 1:
-                print(f"{BLUE}⏱️ MottaSec Ghost is resting for 5 seconds between queries...{RESET}")
-            time.sleep(5)
+                # Set arithmetic runs in C - no per-email Python branch
+                new_emails = set(found_emails) - emails
+                emails |= new_emails
+                yield from new_emails
         
         # MottaSec Ghost reports findings
         if debug >= 1:
-            print(f"{BLUE}📊 MottaSec Ghost's hunt summary: Found {len(emails)} unique email(s) on Twitter{RESET}")
-            
-        return list(emails)
+            log.info("📊 MottaSec Ghost's hunt summary: Found %d unique email(s) on Twitter", len(emails))
         
     except Exception as e:
         if debug >= 1:
-            print(f"{RED}🚨 MottaSec Ghost encountered an error during Twitter hunting: {e}{RESET}")
-        return []
+            log.error("🚨 MottaSec Ghost encountered an error during Twitter hunting: %s", e)
+
+def motta_twitter_hunt(domain, debug=0):
+    """
+    Hunt through Twitter for potential email addresses associated with the domain.
+    
+    Args:
+        domain (str): The domain to search for
+        debug (int): Debug level (0=minimal, 1=moderate, 2=verbose)
+    
+    Returns:
+        set: Unique email addresses found - callers only iterate it
+    """
+    return set(motta_twitter_hunt_stream(domain, debug))
 
 # Aliases for backward compatibility
 setup_twitter_api = motta_setup_twitter_api